@@ -1,29 +1,280 @@
+import argparse
 import boto3
 import uuid
-from datetime import datetime
+from botocore.client import BaseClient
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
-def create_dev_bucket():
+T = TypeVar('T')
+R = TypeVar('R')
+
+BUCKET_PREFIX = "dev-bucket-"
+MAX_WORKERS = 16
+DELETE_BATCH_SIZE = 1000  # delete_objects 한 번에 지울 수 있는 최대 객체 수
+
+
+def get_s3_client(
+    region: Optional[str] = None, max_workers: int = MAX_WORKERS
+) -> BaseClient:
+    """스레드 간 공유할 S3 클라이언트 (연결 풀을 작업자 수에 맞춤)"""
+    return boto3.client(
+        's3',
+        region_name=region,
+        config=Config(max_pool_connections=max_workers)
+    )
+
+
+def create_dev_bucket(
+    s3_client: Optional[BaseClient] = None,
+    region: Optional[str] = None,
+    now: Optional[datetime] = None
+) -> str:
     """개발용 S3 버킷 생성 """
-    s3_client = boto3.client('s3')
-    bucket_name = f"dev-bucket-{str(uuid.uuid4())[:8]}"
+    s3_client = s3_client or boto3.client('s3', region_name=region)
+    region = region or s3_client.meta.region_name
+    now = now or datetime.now()
+    bucket_name = f"{BUCKET_PREFIX}{str(uuid.uuid4())[:8]}"
 
-    s3_client.create_bucket(Bucket=bucket_name)
+    # us-east-1 이외 리전은 LocationConstraint가 필요
+    if region and region != 'us-east-1':
+        s3_client.create_bucket(
+            Bucket=bucket_name,
+            CreateBucketConfiguration={'LocationConstraint': region}
+        )
+    else:
+        s3_client.create_bucket(Bucket=bucket_name)
     print(f"개발용 버킷 생성됨: {bucket_name}")
 
-    # 개발용 태그 추가
-    s3_client.put_bucket_tagging(
-        Bucket=bucket_name,
-        Tagging={
-            'TagSet': [
-                {'Key': 'Environment', 'Value': 'Development'},
-                {'Key': 'CreatedBy', 'Value': 'GitHubActions'},
-                {'Key': 'CreatedDate', 'Value': datetime.now().strftime('%Y-%m-%d')}
-            ]
-        }
-    )
+    # 개발용 태그 추가 (실패하면 태그 없는 버킷이 남지 않도록 바로 삭제)
+    try:
+        s3_client.put_bucket_tagging(
+            Bucket=bucket_name,
+            Tagging={
+                'TagSet': [
+                    {'Key': 'Environment', 'Value': 'Development'},
+                    {'Key': 'CreatedBy', 'Value': 'GitHubActions'},
+                    {'Key': 'CreatedDate', 'Value': now.strftime('%Y-%m-%d')}
+                ]
+            }
+        )
+    except Exception:
+        try:
+            s3_client.delete_bucket(Bucket=bucket_name)
+            print(f"태그 실패로 버킷 삭제됨: {bucket_name}")
+        except ClientError as e:
+            print(
+                f"태그 실패 후 버킷 삭제 실패 (--include-untagged 정리 대상): "
+                f"{bucket_name} ({e})"
+            )
+        raise
 
     return bucket_name
 
+
+def run_each(
+    executor: Executor, fn: Callable[[T], R], items: Iterable[T]
+) -> Tuple[List[R], List[Tuple[T, Exception]]]:
+    """항목별로 fn을 실행하고 (성공 결과 목록, (항목, 오류) 목록)을 반환합니다."""
+    futures = [(item, executor.submit(fn, item)) for item in items]
+    results, errors = [], []
+    for item, future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            errors.append((item, e))
+    return results, errors
+
+
+def create_dev_buckets(
+    count: int,
+    s3_client: Optional[BaseClient] = None,
+    region: Optional[str] = None,
+    now: Optional[datetime] = None,
+    max_workers: int = MAX_WORKERS
+) -> Tuple[List[str], List[Tuple[int, Exception]]]:
+    """
+    개발용 버킷 N개를 동시에 생성하고 태그를 붙입니다 (버킷별 생성+태그는 순서대로).
+
+    일부가 실패해도 나머지는 계속 만들며,
+    (생성된 버킷 목록, (순번, 오류) 목록)을 반환합니다.
+    """
+    workers = max(1, min(count, max_workers))
+    s3_client = s3_client or get_s3_client(region, workers)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return run_each(
+            executor, lambda _: create_dev_bucket(s3_client, region, now), range(count)
+        )
+
+
+def list_dev_buckets(s3_client: BaseClient) -> Dict[str, Optional[datetime]]:
+    """모든 버킷을 페이지 단위로 조회하여 개발용 버킷의 이름 -> 생성 시각을 반환"""
+    buckets = {}
+    if s3_client.can_paginate('list_buckets'):
+        pages = s3_client.get_paginator('list_buckets').paginate()
+    else:
+        pages = [s3_client.list_buckets()]
+
+    for page in pages:
+        buckets.update(
+            (bucket['Name'], bucket.get('CreationDate'))
+            for bucket in page.get('Buckets', [])
+            if bucket['Name'].startswith(BUCKET_PREFIX)
+        )
+    return buckets
+
+
+def get_bucket_tags(s3_client: BaseClient, bucket_name: str) -> Dict[str, str]:
+    """버킷 태그를 dict로 반환 (태그가 없거나 이미 삭제된 버킷은 빈 dict)"""
+    try:
+        tag_set = s3_client.get_bucket_tagging(Bucket=bucket_name)['TagSet']
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('NoSuchTagSet', 'NoSuchBucket'):
+            return {}
+        raise
+    return {tag['Key']: tag['Value'] for tag in tag_set}
+
+
+def is_expired(
+    tags: Dict[str, str],
+    cutoff: datetime,
+    created_at: Optional[datetime] = None,
+    include_untagged: bool = False
+) -> bool:
+    """
+    Environment=Development이고 CreatedDate가 기준일보다 이전인지 확인
+
+    태그가 하나도 없는 버킷(태그 실패 후 삭제도 실패한 경우)은 다른 사람이 같은 접두사로
+    만든 버킷일 수도 있으므로 include_untagged일 때만 버킷 생성 시각으로 판단합니다.
+    """
+    if not tags:
+        return (
+            include_untagged
+            and created_at is not None
+            and created_at.date() < cutoff.date()
+        )
+    if tags.get('Environment') != 'Development':
+        return False
+    try:
+        created = datetime.strptime(tags.get('CreatedDate', ''), '%Y-%m-%d')
+    except ValueError:
+        return False
+    return created.date() < cutoff.date()
+
+
+def empty_bucket(s3_client: BaseClient, bucket_name: str) -> int:
+    """모든 객체 버전과 삭제 마커를 1,000개 단위 delete_objects로 지웁니다."""
+    deleted = 0
+    paginator = s3_client.get_paginator('list_object_versions')
+    batch = []
+
+    def flush() -> None:
+        nonlocal deleted
+        response = s3_client.delete_objects(
+            Bucket=bucket_name,
+            Delete={'Objects': batch, 'Quiet': True}
+        )
+        errors = response.get('Errors', [])
+        if errors:
+            raise RuntimeError(
+                f"{bucket_name}: 객체 {len(errors)}개 삭제 실패 "
+                f"({errors[0].get('Message')})"
+            )
+        deleted += len(batch)
+        batch.clear()
+
+    # 삭제 도중 페이지 마커가 가리키던 버전이 사라질 수 있으므로 빈 목록이 나올 때까지 반복
+    while True:
+        deleted_before = deleted
+        for page in paginator.paginate(Bucket=bucket_name):
+            for item in page.get('Versions', []) + page.get('DeleteMarkers', []):
+                batch.append({'Key': item['Key'], 'VersionId': item['VersionId']})
+                if len(batch) == DELETE_BATCH_SIZE:
+                    flush()
+        if batch:
+            flush()
+        if deleted == deleted_before:
+            return deleted
+
+
+def delete_dev_bucket(s3_client: BaseClient, bucket_name: str) -> str:
+    """버킷을 비운 뒤 삭제"""
+    deleted = empty_bucket(s3_client, bucket_name)
+    s3_client.delete_bucket(Bucket=bucket_name)
+    print(f"만료된 개발용 버킷 삭제됨: {bucket_name} (객체 {deleted}개)")
+    return bucket_name
+
+
+def reap_dev_buckets(
+    max_age_days: int = 7,
+    s3_client: Optional[BaseClient] = None,
+    region: Optional[str] = None,
+    now: Optional[datetime] = None,
+    max_workers: int = MAX_WORKERS,
+    dry_run: bool = False,
+    include_untagged: bool = False
+) -> Tuple[List[str], List[Tuple[str, Exception]]]:
+    """
+    CreatedDate 태그가 max_age_days보다 오래된 개발용 버킷을 삭제합니다.
+
+    이름이 dev-bucket-으로 시작하고 Environment=Development 태그가 있는 버킷이 대상이며,
+    include_untagged면 태그가 없고 생성된 지 max_age_days가 지난 버킷도 삭제합니다.
+    태그 조회와 버킷 비우기/삭제는 스레드 풀에서 병렬로 수행하며, 버킷별 실패는 모아서
+    (삭제한(dry run이면 삭제 대상) 버킷 목록, (버킷, 오류) 목록)으로 반환합니다.
+    """
+    s3_client = s3_client or get_s3_client(region, max_workers)
+    cutoff = (now or datetime.now()) - timedelta(days=max_age_days)
+    buckets = list_dev_buckets(s3_client)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        tagged, errors = run_each(
+            executor, lambda name: (name, get_bucket_tags(s3_client, name)), buckets
+        )
+        expired = [
+            name for name, tags in tagged
+            if is_expired(tags, cutoff, buckets[name], include_untagged)
+        ]
+
+        if dry_run:
+            for name in expired:
+                print(f"삭제 대상 (dry run): {name}")
+            return expired, errors
+
+        deleted, delete_errors = run_each(
+            executor, lambda name: delete_dev_bucket(s3_client, name), expired
+        )
+        return deleted, errors + delete_errors
+
+
 if __name__ == "__main__":
-    bucket = create_dev_bucket()
-    print(f"✅ Dev bucket ready: {bucket}")
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="개발용 S3 버킷 생성/정리")
+    parser.add_argument("--count", type=int, default=1, help="생성할 버킷 수")
+    parser.add_argument(
+        "--reap", type=int, metavar="DAYS", help="DAYS일보다 오래된 개발용 버킷 삭제"
+    )
+    parser.add_argument(
+        "--include-untagged", action="store_true",
+        help="태그가 없는 dev-bucket-* 버킷도 생성 시각으로 판단하여 삭제"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 출력")
+    args = parser.parse_args()
+
+    if args.reap is not None:
+        reaped, errors = reap_dev_buckets(
+            args.reap, dry_run=args.dry_run, include_untagged=args.include_untagged
+        )
+        print(f"🧹 Reaped {len(reaped)} dev bucket(s)")
+        for bucket, error in errors:
+            print(f"❌ {bucket}: {error}")
+    else:
+        created, errors = create_dev_buckets(args.count)
+        for bucket in created:
+            print(f"✅ Dev bucket ready: {bucket}")
+        for index, error in errors:
+            print(f"❌ Dev bucket #{index + 1} failed: {error}")
+
+    if errors:
+        raise SystemExit(1)
@@ -0,0 +1,239 @@
+"""
+생성된 Strands Agent용 Strands/boto3 대역(stub) 모듈
+
+`BedrockModel`, `Agent`, 대화 관리자, `strands_tools`, boto3 클라이언트를 네트워크
+호출 없이 설정한 지연 시간만 흉내 내는 대역으로 바꿉니다. 부하 테스트 하네스
+(`load_test_generated_agents.py`)와 콜드 스타트 프로파일러(`profile_generated_agent`)가
+같은 정의를 사용합니다. 표준 라이브러리만 import하므로 프로파일링 하위 프로세스에
+그대로 복사해 쓸 수 있습니다.
+"""
+
+import asyncio
+import inspect
+import sys
+import threading
+import time
+import types
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+STUB_MODULE_NAMES = [
+    "strands",
+    "strands.models",
+    "strands.tools",
+    "strands.agent",
+    "strands.agent.conversation_manager",
+    "strands_tools",
+    "boto3",
+]
+
+
+class StubLatency:
+    """대역 모델/클라이언트가 사용하는 지연 시간 설정 (초 단위)"""
+
+    model = 0.1
+    aws = 0.01
+    stream_tokens = 20
+
+
+class StubResult:
+    """Agent 호출 결과 대역"""
+
+    def __init__(self, text: str) -> None:
+        self.message = {"role": "assistant", "content": [{"text": text}]}
+        self.text = text
+
+    def __str__(self) -> str:
+        return self.text
+
+
+class StubBedrockModel:
+    """네트워크 호출 없이 설정만 보관하는 BedrockModel 대역"""
+
+    def __init__(self, **config: Any) -> None:
+        self.config = config
+
+
+class StubSummarizingConversationManager:
+    """오래된 메시지를 요약 메시지 하나로 대체하는 대화 관리자 대역"""
+
+    def __init__(
+        self,
+        summary_ratio: float = 0.3,
+        preserve_recent_messages: int = 10,
+        **kwargs: Any
+    ) -> None:
+        self.summary_ratio = summary_ratio
+        self.preserve_recent_messages = preserve_recent_messages
+
+    def apply_management(self, agent: "StubAgent", **kwargs: Any) -> None:
+        """기본 동작은 관리하지 않음 (컨텍스트 초과 시에만 요약)"""
+
+    def reduce_context(
+        self, agent: "StubAgent", e: Optional[Exception] = None, **kwargs: Any
+    ) -> None:
+        """요약 호출 지연을 흉내 내고 최근 메시지만 남깁니다."""
+        time.sleep(StubLatency.model)
+        recent = agent.messages[-self.preserve_recent_messages:]
+        summary = {"role": "user", "content": [{"text": "이전 대화 요약"}]}
+        agent.messages[:] = [summary] + recent
+
+
+class StubAgent:
+    """
+    모델 호출을 지연 시간으로 대체한 Agent 대역
+
+    호출마다 모델 지연을 한 번 겪고, 문자열 인자 하나를 받는 도구가 있으면
+    모두 호출한 뒤(멀티 에이전트의 하위 에이전트 호출 포함) 한 번 더 모델
+    지연을 겪습니다. 실제 Agent처럼 같은 인스턴스의 동시 호출은 오류입니다.
+    """
+
+    def __init__(
+        self,
+        model: Any = None,
+        tools: Optional[List[Callable[..., Any]]] = None,
+        messages: Optional[List[Dict[str, Any]]] = None,
+        system_prompt: Optional[str] = None,
+        conversation_manager: Any = None,
+        **kwargs: Any
+    ) -> None:
+        self.model = model
+        self.tools = list(tools or [])
+        self.system_prompt = system_prompt
+        self.conversation_manager = conversation_manager
+        self.messages: List[Dict[str, Any]] = messages if messages is not None else []
+        self.lock = threading.Lock()
+
+    def _single_text_tools(self) -> List[Callable[..., Any]]:
+        """프롬프트 하나로 호출할 수 있는 도구만 고릅니다."""
+        tools = []
+        for tool in self.tools:
+            parameters = [
+                parameter for parameter in inspect.signature(tool).parameters.values()
+                if parameter.default is inspect.Parameter.empty
+                and parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+            ]
+            if len(parameters) == 1:
+                tools.append(tool)
+        return tools
+
+    def _begin(self) -> None:
+        if not self.lock.acquire(blocking=False):
+            raise RuntimeError("에이전트가 이미 다른 요청을 처리 중입니다 (Agent는 동시 호출을 지원하지 않습니다).")
+
+    def _record(self, prompt: str, text: str) -> None:
+        self.messages.append({"role": "user", "content": [{"text": prompt}]})
+        self.messages.append({"role": "assistant", "content": [{"text": text}]})
+        if self.conversation_manager is not None:
+            self.conversation_manager.apply_management(self)
+
+    def __call__(self, prompt: str) -> StubResult:
+        self._begin()
+        try:
+            time.sleep(StubLatency.model)
+            tools = self._single_text_tools()
+            for tool in tools:
+                tool(prompt)
+            if tools:
+                time.sleep(StubLatency.model)
+
+            text = f"stub 응답: {prompt[:40]}"
+            self._record(prompt, text)
+            return StubResult(text)
+        finally:
+            self.lock.release()
+
+    async def stream_async(self, prompt: str) -> Any:
+        """모델 지연을 토큰 수만큼 나누어 토큰 이벤트를 흘려보냅니다."""
+        self._begin()
+        try:
+            tokens = max(StubLatency.stream_tokens, 1)
+            for index in range(tokens):
+                await asyncio.sleep(StubLatency.model / tokens)
+                yield {"data": f"t{index} "}
+            self._record(prompt, "stub 스트리밍 응답")
+            yield {"result": StubResult("stub 스트리밍 응답")}
+        finally:
+            self.lock.release()
+
+
+class StubAwsClient:
+    """모든 API 호출이 지연 후 빈 응답을 반환하는 boto3 클라이언트 대역"""
+
+    def __init__(self, service_name: str) -> None:
+        self.service_name = service_name
+
+    def __getattr__(self, name: str) -> Callable[..., Dict[str, Any]]:
+        def call(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            time.sleep(StubLatency.aws)
+            return {"Items": [], "Contents": []}
+        return call
+
+
+class StubAwsResource(StubAwsClient):
+    """boto3 리소스 대역 (`Table()` 등 대문자 하위 리소스도 클라이언트 대역으로 반환)"""
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if not name[:1].isupper():
+            return super().__getattr__(name)
+
+        def sub_resource(identifier: str, *args: Any) -> StubAwsClient:
+            return StubAwsClient(f"{self.service_name}:{name}:{identifier}")
+        return sub_resource
+
+
+def build_stub_modules() -> Dict[str, types.ModuleType]:
+    """생성 코드가 import하는 Strands/boto3 모듈의 대역을 만듭니다."""
+
+    def tool(function: Optional[Callable[..., Any]] = None, **kwargs: Any) -> Any:
+        if function is None:
+            return lambda inner: inner
+        return function
+
+    def builtin_tool(name: str) -> Callable[..., str]:
+        def stub_tool(**kwargs: Any) -> str:
+            return f"{name} stub"
+        stub_tool.__name__ = name
+        return stub_tool
+
+    modules = {name: types.ModuleType(name) for name in STUB_MODULE_NAMES}
+    modules["strands"].Agent = StubAgent
+    modules["strands"].tool = tool
+    modules["strands.models"].BedrockModel = StubBedrockModel
+    modules["strands.tools"].tool = tool
+    modules["strands.agent"].Agent = StubAgent
+    modules["strands.agent.conversation_manager"].SummarizingConversationManager = (
+        StubSummarizingConversationManager
+    )
+    modules["strands.agent.conversation_manager"].SlidingWindowConversationManager = (
+        StubSummarizingConversationManager
+    )
+    modules["strands_tools"].__getattr__ = builtin_tool
+    modules["boto3"].client = (
+        lambda service_name, **kwargs: StubAwsClient(service_name)
+    )
+    modules["boto3"].resource = (
+        lambda service_name, **kwargs: StubAwsResource(service_name)
+    )
+    return modules
+
+
+@contextmanager
+def stubbed_dependencies() -> Iterator[None]:
+    """`sys.modules`의 Strands/boto3를 대역으로 바꾸고 끝나면 복원합니다."""
+
+    saved = {name: sys.modules.get(name) for name in STUB_MODULE_NAMES}
+    sys.modules.update(build_stub_modules())
+    try:
+        yield
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+
+def install_stub_modules() -> None:
+    """`sys.modules`에 대역을 설치합니다 (복원하지 않는 하위 프로세스용)."""
+    sys.modules.update(build_stub_modules())
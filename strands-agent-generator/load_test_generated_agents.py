@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+생성된 Strands Agent 부하 테스트 하네스
+
+`generate_strands_agent`로 생성한 프로젝트를 불러와 `BedrockModel`과 boto3
+클라이언트를 지연 시간을 설정할 수 있는 로컬 대역(stub, `generated_agent_stubs.py`)으로 바꾼 뒤,
+N개의 동시 대화를 실행하여 에이전트 타입별 처리량, p50/p99 지연 시간,
+최대 RSS를 측정합니다. Bedrock을 호출하지 않고 템플릿 회귀를 잡기 위한 도구입니다.
+
+코드 생성은 부모 프로세스에서 하고, 타입별 측정 프로세스는 생성된 main.py만
+import하므로 최대 RSS에 생성기(mcp, pydantic, numpy)가 포함되지 않습니다.
+대화마다 에이전트가 따로 만들어집니다 (Lambda 프로젝트는 대화마다 main.py를
+따로 import하여 컨테이너 하나씩을 흉내 냅니다).
+
+사용 예:
+    python load_test_generated_agents.py --conversations 50 --turns 3
+    python load_test_generated_agents.py --agent-types basic multi_agent \\
+        --model-latency-ms 200 --aws-latency-ms 20 --json
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import multiprocessing
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from generated_agent_stubs import StubLatency, stubbed_dependencies
+
+DEFAULT_REQUIREMENTS = "고객 주문을 처리하고 S3에 저장하는 에이전트"
+
+
+def generate_project_code(
+    agent_type: str,
+    requirements: str,
+    deployment_target: str
+) -> str:
+    """생성기로 프로젝트를 만들고 main.py 코드를 반환합니다 (부모 프로세스에서 실행)."""
+
+    from strands_agent_generator_mcp import generate_strands_agent
+
+    # MCP 도구는 스레드 풀 실행 래퍼(비동기)로 등록되므로 원래 동기 함수를 호출
+    result = generate_strands_agent.__wrapped__(
+        requirements,
+        agent_type=agent_type,
+        deployment_target=deployment_target
+    )
+    if not result["success"]:
+        raise RuntimeError(f"코드 생성 실패: {result['error']}")
+    return result["data"]["main_code"]
+
+
+def load_generated_module(main_code: str, name: str) -> types.ModuleType:
+    """생성된 main.py를 대역 의존성으로 import합니다 (호출마다 새 모듈)."""
+
+    with tempfile.TemporaryDirectory(prefix=f"strands-load-{name}-") as project_dir:
+        main_path = Path(project_dir) / "main.py"
+        main_path.write_text(main_code, encoding="utf-8")
+
+        spec = importlib.util.spec_from_file_location(name, main_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+def build_turn(
+    module: types.ModuleType,
+    session_id: str
+) -> Callable[[str], Optional[float]]:
+    """
+    생성된 모듈의 진입점으로 대화 하나의 턴을 실행하는 함수를 만듭니다.
+
+    응답 스트리밍 Lambda 프로젝트는 ASGI `app`, 그 외 Lambda 프로젝트는 `handler()`에
+    `session_id`를 함께 보내 대화를 이어가고, 스트리밍 에이전트는 `stream_async()`,
+    그 외에는 이 대화 전용으로 `create_agent()`한 에이전트를 직접 호출합니다.
+    스트리밍이면 첫 토큰까지의 시간을 반환합니다.
+    """
+
+    if hasattr(module, "app"):
+        def asgi_turn(prompt: str) -> Optional[float]:
+            async def consume() -> Optional[float]:
+                payload = {"prompt": prompt, "session_id": session_id}
+                body = json.dumps(payload).encode("utf-8")
+                start = time.perf_counter()
+                first_token = None
+                status = None
+
+                async def receive() -> Dict[str, Any]:
+                    return {"type": "http.request", "body": body, "more_body": False}
+
+                async def send(message: Dict[str, Any]) -> None:
+                    nonlocal first_token, status
+                    if message["type"] == "http.response.start":
+                        status = message["status"]
+                    elif first_token is None and message.get("body"):
+                        first_token = time.perf_counter() - start
+
+                await module.app({"type": "http", "method": "POST"}, receive, send)
+                if status != 200:
+                    raise RuntimeError(f"HTTP {status}")
+                return first_token
+            return asyncio.run(consume())
+        return asgi_turn
+
+    if hasattr(module, "handler"):
+        def lambda_turn(prompt: str) -> Optional[float]:
+            event = {"prompt": prompt, "session_id": session_id}
+            response = module.handler(event, None)
+            if response["statusCode"] != 200:
+                raise RuntimeError(response["body"])
+            return None
+        return lambda_turn
+
+    agent = module.create_agent()
+
+    if hasattr(module, "stream_reply"):
+        def streaming_turn(prompt: str) -> Optional[float]:
+            async def consume() -> Optional[float]:
+                start = time.perf_counter()
+                first_token = None
+                async for event in agent.stream_async(prompt):
+                    if first_token is None and event.get("data"):
+                        first_token = time.perf_counter() - start
+                return first_token
+            return asyncio.run(consume())
+        return streaming_turn
+
+    def direct_turn(prompt: str) -> Optional[float]:
+        agent(prompt)
+        return None
+    return direct_turn
+
+
+def percentile(values: List[float], q: int) -> float:
+    """q번째 백분위수 (값이 하나면 그 값)"""
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+def peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (MB)"""
+    # Linux의 ru_maxrss는 exec 이전(spawn한 부모) 값을 물려받으므로 VmHWM을 우선 사용
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_load_test(
+    agent_type: str,
+    main_code: str,
+    conversations: int,
+    turns: int,
+    model_latency_ms: float,
+    aws_latency_ms: float,
+    stream_tokens: int,
+    deployment_target: str
+) -> Dict[str, Any]:
+    """생성된 main.py로 동시 대화를 실행하고 지표를 반환합니다."""
+
+    StubLatency.model = model_latency_ms / 1000
+    StubLatency.aws = aws_latency_ms / 1000
+    StubLatency.stream_tokens = stream_tokens
+
+    with stubbed_dependencies():
+        baseline_rss = peak_rss_mb()
+        module = load_generated_module(main_code, f"generated_{agent_type}")
+        is_lambda = hasattr(module, "handler")
+
+        # Lambda 컨테이너는 한 번에 한 요청만 처리하므로 동시 대화마다 모듈(컨테이너)을 따로 둡니다
+        conversation_turns = [
+            build_turn(
+                load_generated_module(main_code, f"generated_{agent_type}_{index}")
+                if is_lambda and index else module,
+                f"conversation-{index}"
+            )
+            for index in range(conversations)
+        ]
+
+        latencies: List[float] = []
+        first_tokens: List[float] = []
+        errors: List[str] = []
+        lock = threading.Lock()
+
+        def conversation(index: int) -> None:
+            turn = conversation_turns[index]
+            for number in range(turns):
+                start = time.perf_counter()
+                try:
+                    first_token = turn(f"대화 {index}의 {number + 1}번째 요청입니다.")
+                except Exception as e:
+                    with lock:
+                        errors.append(f"{type(e).__name__}: {e}")
+                    continue
+                elapsed = time.perf_counter() - start
+                with lock:
+                    latencies.append(elapsed)
+                    if first_token is not None:
+                        first_tokens.append(first_token)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=conversations) as executor:
+            list(executor.map(conversation, range(conversations)))
+        wall_time = time.perf_counter() - started
+
+    latencies_ms = [latency * 1000 for latency in latencies]
+    report = {
+        "agent_type": agent_type,
+        "deployment_target": deployment_target,
+        "conversations": conversations,
+        "turns": len(latencies),
+        "errors": len(errors),
+        "throughput_rps": round(len(latencies) / wall_time, 2) if wall_time else 0.0,
+        "p50_ms": round(percentile(latencies_ms, 50), 2),
+        "p99_ms": round(percentile(latencies_ms, 99), 2),
+        "baseline_rss_mb": round(baseline_rss, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1)
+    }
+    if first_tokens:
+        first_token_ms = [t * 1000 for t in first_tokens]
+        report["p50_first_token_ms"] = round(percentile(first_token_ms, 50), 2)
+    if errors:
+        report["first_error"] = errors[0]
+    return report
+
+
+def run_isolated(**kwargs: Any) -> Dict[str, Any]:
+    """최대 RSS가 타입별로 섞이지 않도록 main.py만 import하는 새 프로세스에서 실행합니다."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(run_load_test, **kwargs).result()
+
+
+def print_report(reports: List[Dict[str, Any]]) -> None:
+    """측정 결과를 표로 출력합니다."""
+    header = (
+        f"{'agent_type':<16}{'turns':>7}{'errors':>8}{'rps':>9}"
+        f"{'p50 ms':>10}{'p99 ms':>10}{'peak RSS MB':>13}"
+    )
+    print(header)
+    print("-" * len(header))
+    for report in reports:
+        print(
+            f"{report['agent_type']:<16}{report['turns']:>7}{report['errors']:>8}"
+            f"{report['throughput_rps']:>9}{report['p50_ms']:>10}{report['p99_ms']:>10}"
+            f"{report['peak_rss_mb']:>13}"
+        )
+        if "first_error" in report:
+            print(f"  ⚠️ {report['first_error']}")
+
+
+def main() -> None:
+    """명령행 인자를 읽어 에이전트 타입별 부하 테스트를 실행합니다."""
+    parser = argparse.ArgumentParser(description="생성된 Strands Agent 로컬 부하 테스트")
+    parser.add_argument("--agent-types", nargs="+", default=["basic", "multi_agent"])
+    parser.add_argument("--conversations", type=int, default=20, help="동시 대화 수")
+    parser.add_argument("--turns", type=int, default=3, help="대화당 턴 수")
+    parser.add_argument("--model-latency-ms", type=float, default=100.0)
+    parser.add_argument("--aws-latency-ms", type=float, default=10.0)
+    parser.add_argument("--stream-tokens", type=int, default=20)
+    parser.add_argument("--requirements", default=DEFAULT_REQUIREMENTS)
+    parser.add_argument("--deployment-target", default="lambda")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    reports = [
+        run_isolated(
+            agent_type=agent_type,
+            main_code=generate_project_code(
+                agent_type, args.requirements, args.deployment_target
+            ),
+            conversations=args.conversations,
+            turns=args.turns,
+            model_latency_ms=args.model_latency_ms,
+            aws_latency_ms=args.aws_latency_ms,
+            stream_tokens=args.stream_tokens,
+            deployment_target=args.deployment_target
+        )
+        for agent_type in args.agent_types
+    ]
+
+    if args.json:
+        print(json.dumps(reports, ensure_ascii=False, indent=2))
+    else:
+        print_report(reports)
+
+
+if __name__ == "__main__":
+    main()
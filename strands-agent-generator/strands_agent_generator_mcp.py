@@ -6,19 +6,531 @@ Strands Agent 자동 생성 MCP 서버
 Strands Agent 코드를 자동으로 생성합니다.
 """
 
+import ast
+import asyncio
+import difflib
+import functools
+import hashlib
+import inspect
 import json
 import os
+import re
+import subprocess
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+import weakref
+import zlib
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.resources import Resource
+from mcp.server.lowlevel import NotificationOptions
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+from mcp.shared.exceptions import McpError
+from mcp.types import ErrorData
+from mcp.types import Resource as MCPResource
+from pydantic import AnyUrl
 
 # 크롤링 데이터 경로
 CRAWLING_DATA_PATH = "/home/workspace/Q/strands-crawling-data"
 
-mcp = FastMCP(
+# MCP 리소스로 제공하는 크롤링 데이터 파일 (키: URI, 파일명, 제목)
+CRAWLING_DATA_FILES = {
+    "guide": (
+        "strands://guide", "strands-comprehensive-guide.md", "Strands Agents 종합 가이드"
+    ),
+    "samples": (
+        "strands://samples", "strands-samples-collection.md", "Strands 샘플 모음"
+    ),
+    "api": (
+        "strands://api-reference", "strands-api-reference.md", "Strands API 레퍼런스"
+    )
+}
+RESOURCE_POLL_INTERVAL_S = 5.0
+RESOURCE_INDEX_URI = "strands://index"
+# MCP 명세의 리소스 없음 오류 코드
+RESOURCE_NOT_FOUND = -32002
+
+STRANDS_EXAMPLES_OVERVIEW = """
+# 크롤링한 실제 Strands Agent 예시들
+
+## 1. 비즈니스 애플리케이션
+- **레스토랑 어시스턴트**: 주문 처리, 메뉴 관리, 예약 시스템
+- **개인 비서**: 일정 관리, 이메일 처리, 검색 기능
+- **스크럼 마스터**: 프로젝트 관리, 회의 노트, 작업 추적
+
+## 2. 금융 서비스
+- **개인 금융 어시스턴트**: 예산 관리, 투자 분석, 지출 추적
+- **금융 분석 스웜**: 주식 분석, 시장 데이터, 리스크 평가
+- **WhatsApp 핀테크**: 모바일 결제, 송금, 계좌 조회
+
+## 3. 기술 지원
+- **코드 어시스턴트**: 코드 리뷰, 버그 수정, 문서 생성
+- **AWS 감사 어시스턴트**: 리소스 모니터링, 비용 분석, 보안 검사
+- **데이터 웨어하우스 최적화**: 쿼리 최적화, 성능 분석
+
+## 4. 의료 및 전문 서비스
+- **의료 문서 처리**: 진료 기록, 처방전, 보험 청구
+- **멀티모달 이메일 어시스턴트**: 이미지 분석, 문서 처리
+
+## 5. 데이터 분석
+- **게임 판매 분석**: 매출 분석, 트렌드 예측
+- **HVAC 데이터 분석**: IoT 데이터, 에너지 효율성
+
+이 예시들을 참고하여 원하는 에이전트를 요청하세요!
+"""
+
+# Lambda 배포 설정 산정 기준 (에이전트 타입별 기본값 + 서비스별 가산치)
+LAMBDA_BASE_MEMORY_MB = {"basic": 512, "conversational": 768, "multi_agent": 1024}
+LAMBDA_BASE_TIMEOUT_S = {"basic": 60, "conversational": 120, "multi_agent": 300}
+LAMBDA_SERVICE_MEMORY_MB = {
+    "bedrock": 0,
+    "s3": 128,
+    "dynamodb": 128,
+    "lambda": 64,
+    "sqs": 64,
+    "sns": 64
+}
+LAMBDA_SERVICE_TIMEOUT_S = {
+    "bedrock": 0,
+    "s3": 30,
+    "dynamodb": 15,
+    "lambda": 30,
+    "sqs": 10,
+    "sns": 10
+}
+LAMBDA_MAX_MEMORY_MB = 10240
+LAMBDA_MAX_TIMEOUT_S = 900
+# Lambda 컨테이너가 메모리에 보관하는 세션(대화 기록) 수
+LAMBDA_MAX_SESSIONS = 100
+# 대화형 에이전트의 응답 스트리밍에 사용하는 Lambda Web Adapter 레이어 (us-west-2, x86_64)
+LAMBDA_WEB_ADAPTER_LAYER = "arn:aws:lambda:us-west-2:753240598075:layer:LambdaAdapterLayerX86:25"
+LAMBDA_WEB_ADAPTER_PORT = 8080
+
+# 에이전트 타입별 응답 토큰 예산
+AGENT_MAX_TOKENS = {"basic": 2000, "conversational": 1024, "multi_agent": 4096}
+
+# 프롬프트 토큰 추정 기준 (Bedrock 프롬프트 캐시는 1,024 토큰 이상부터 적용)
+PROMPT_CACHE_MIN_TOKENS = 1024
+TOOL_SPEC_BASE_TOKENS = 40
+BUILTIN_TOOL_SPEC_TOKENS = 250
+
+# 대화형 에이전트의 대화 창 크기 (이를 넘는 오래된 턴은 요약)
+CONVERSATION_WINDOW_MESSAGES = 20
+CONVERSATION_PRESERVED_MESSAGES = 10
+
+# 샘플 예시 검색 설정 (해시 n-gram 차원, 발췌 길이)
+EXAMPLE_HASH_DIM = 2 ** 12
+EXAMPLE_EXCERPT_CHARS = 400
+EXAMPLE_SUMMARY_CHARS = 100
+
+# 같은 입력의 재생성 요청에 재사용하는 프로젝트 렌더링 결과 수
+PROJECT_CACHE_SIZE = 64
+
+# 매니페스트 섹션별로 다시 렌더링해야 하는 프로젝트 파일
+MANIFEST_SECTION_FILES = {
+    "tools": ["main.py"],
+    "system_prompt": ["main.py"],
+    "model_config": ["main.py"],
+    "entrypoint": ["main.py", "run.sh"],
+    "requirements_txt": ["requirements.txt"],
+    "readme": ["README.md"],
+    "deployment_config": ["deployment_config.json"]
+}
+
+# 코드 검증 설정
+MAX_LINE_LENGTH = 88
+VALIDATION_CACHE_SIZE = 512
+VALIDATION_SUGGESTIONS = {
+    "syntax": "문법 오류를 먼저 수정한 뒤 다시 검증하세요.",
+    "tab": "탭 문자를 4칸 스페이스로 바꾸세요.",
+    "line-length": "긴 줄은 괄호 안에서 줄바꿈하여 88자 이하로 맞추세요.",
+    "naming": "함수 이름은 snake_case를 사용하세요.",
+    "type-hints": "모든 인자와 반환값에 타입 힌트를 추가하세요.",
+    "implicit-optional": "기본값이 None인 인자는 Optional[...]로 선언하세요.",
+    "tool-docstring": "@tool 함수에 도구 설명이 될 docstring을 추가하세요.",
+    "strands-import": "Agent(...)를 호출하는 파일에는 from strands import Agent, @tool 도구를 정의하는 파일에는 from strands import tool 을 추가하세요.",
+    "tool-registration": "정의한 도구를 Agent(tools=[...])에 등록하거나 사용하지 않는 도구를 제거하세요."
+}
+
+# 콜드 스타트 프로파일링 설정 (하위 프로세스 제한 시간, 보고할 상위 import 수)
+PROFILE_TIMEOUT_S = 120
+PROFILE_TOP_IMPORTS = 15
+COLD_START_SUGGESTIONS = {
+    "eager-aws-client": "boto3 클라이언트는 처음 필요할 때 생성하거나 핸들러 밖 지연 초기화 함수로 옮기세요.",
+    "eager-agent": "BedrockModel은 get_agent_factory() 같은 지연 초기화 함수에서 한 번만 생성하고 Agent는 요청마다 만드세요.",
+    "agent-in-tool": "@tool 안에서 매 호출마다 Agent를 만들지 말고 한 번 만든 하위 에이전트를 재사용하세요.",
+    "client-in-tool": "@tool 안에서 매 호출마다 boto3 클라이언트를 만들지 말고 재사용하세요."
+}
+
+# 프로파일링 시 실제 패키지 대신 사용하는 대역 모듈 (부하 테스트 하네스와 같은 정의)
+PROFILE_STUB_MODULE = Path(__file__).with_name("generated_agent_stubs.py")
+
+# get_agent() 지연 초기화 중의 -X importtime 출력을 구분하는 stderr 표시 줄
+# (PROFILE_RUNNER가 같은 문자열을 출력)
+LAZY_INIT_START = "__LAZY_INIT_START__"
+LAZY_INIT_END = "__LAZY_INIT_END__"
+
+# 하위 프로세스에 넘기는 AWS_* 환경 변수 (자격 증명, 프로필 등 나머지는 제외)
+PROFILE_ENV_KEEP_AWS = ("AWS_REGION", "AWS_DEFAULT_REGION")
+
+# 하위 프로세스에서 main.py를 import하고 초기화 시간과 최대 RSS를 출력하는 스크립트
+# (Linux의 ru_maxrss는 exec 전 부모 프로세스 값을 물려받으므로 VmHWM을 우선 사용하고,
+#  json은 main.py의 import 비용에 섞이지 않도록 main 이후에 import,
+#  --stubs면 대역 모듈을 측정 시작 전에 설치하여 대역의 import 비용은 제외,
+#  get_agent()의 지연 import는 stderr 표시 줄 사이에 기록)
+PROFILE_RUNNER = """\
+import resource
+import sys
+import time
+
+if "--stubs" in sys.argv:
+    import generated_agent_stubs
+    generated_agent_stubs.install_stub_modules()
+
+
+def peak_rss_bytes():
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+baseline_rss = peak_rss_bytes()
+started = time.perf_counter()
+import main
+result = {"import_s": time.perf_counter() - started}
+
+if callable(getattr(main, "get_agent", None)):
+    print("__LAZY_INIT_START__", file=sys.stderr, flush=True)
+    started = time.perf_counter()
+    main.get_agent()
+    result["lazy_init_s"] = time.perf_counter() - started
+    print("__LAZY_INIT_END__", file=sys.stderr, flush=True)
+
+result["baseline_rss_bytes"] = baseline_rss
+result["peak_rss_bytes"] = peak_rss_bytes()
+
+import json
+print("__PROFILE__" + json.dumps(result))
+"""
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$")
+
+# 동기 도구 실행 설정 (공용 스레드 풀 크기, 도구별 동시 실행 수/대기열 길이 기본값)
+TOOL_EXECUTOR_WORKERS = 8
+TOOL_MAX_CONCURRENCY = 4
+TOOL_MAX_QUEUE = 16
+TOOL_METRICS_WINDOW = 1000
+
+# 파일 해시(sha256) -> 분석 결과 (LRU, 여러 도구 스레드가 함께 쓰므로 잠금으로 보호)
+_validation_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_validation_cache_lock = threading.Lock()
+_example_index: Optional["ExampleIndex"] = None
+
+# URI별 구독 세션, 리소스 목록을 조회한 세션(목록 변경 알림 대상), 변경 감시 작업
+_resource_subscriptions: Dict[str, "weakref.WeakSet[Any]"] = {}
+_resource_list_sessions: "weakref.WeakSet[Any]" = weakref.WeakSet()
+_resource_refresh_lock = threading.Lock()
+_resource_watcher: Optional["asyncio.Task[None]"] = None
+_resource_watcher_users = 0
+
+# 동기 도구를 실행하는 스레드 풀과 도구별 실행 지표
+_tool_executor: Optional[ThreadPoolExecutor] = None
+_tool_metrics: Dict[str, "ToolMetrics"] = {}
+
+
+class CrawlingDataResource(Resource):
+    """
+    크롤링 데이터 파일(또는 고정 텍스트)을 제공하는 MCP 리소스
+
+    파일의 수정 시간과 크기가 바뀐 경우에만 다시 읽어 내용, 크기, sha256을 갱신하므로
+    여러 번 읽어도 디스크에서 다시 읽거나 문자열을 다시 만들지 않습니다.
+    """
+
+    path: Optional[Path] = None
+    text: str = ""
+    summary: str = ""
+    exists: bool = False
+    size: int = 0
+    sha256: str = ""
+    mtime_ns: int = 0
+
+    def refresh(self) -> bool:
+        """원본이 바뀌었으면 캐시를 갱신하고 True를 반환합니다."""
+
+        if self.path is None:
+            text = self.text
+        else:
+            try:
+                stat = self.path.stat()
+            except FileNotFoundError:
+                changed = self.exists
+                self.exists, self.text, self.size, self.sha256, self.mtime_ns = False, "", 0, "", 0
+                self.description = f"{self.summary} (파일 없음)"
+                return changed
+
+            if self.exists and (stat.st_mtime_ns, stat.st_size) == (self.mtime_ns, self.size):
+                return False
+            text = self.path.read_text(encoding="utf-8")
+            self.mtime_ns = stat.st_mtime_ns
+
+        encoded = text.encode("utf-8")
+        digest = hashlib.sha256(encoded).hexdigest()
+        changed = digest != self.sha256
+
+        self.exists, self.text, self.size, self.sha256 = True, text, len(encoded), digest
+        self.description = f"{self.summary} ({self.size} bytes, sha256 {digest[:12]})"
+        return changed
+
+    def info(self) -> Dict[str, Any]:
+        """리소스 목록(index)에 노출할 메타데이터"""
+
+        return {
+            "uri": str(self.uri),
+            "name": self.name,
+            "mime_type": self.mime_type,
+            "exists": self.exists,
+            "size": self.size,
+            "sha256": self.sha256
+        }
+
+    async def read(self) -> str:
+        """
+        캐시된 내용을 반환합니다.
+
+        원본 확인은 변경 감시 작업이 맡으며, 감시 작업이 없을 때만(서버 lifespan 밖)
+        이벤트 루프를 막지 않도록 스레드에서 확인합니다.
+        """
+
+        if _resource_watcher is None:
+            await asyncio.to_thread(refresh_crawling_resources)
+        if not self.exists:
+            # 빈 파일과 구분되도록 빈 문자열 대신 리소스 없음 오류를 냅니다
+            raise McpError(ErrorData(
+                code=RESOURCE_NOT_FOUND,
+                message=f"리소스 원본 파일이 없습니다: {self.uri} ({self.path})",
+                data={"uri": str(self.uri)}
+            ))
+        return self.text
+
+
+def build_crawling_resources() -> Dict[str, CrawlingDataResource]:
+    """예시, 가이드, 샘플, API 레퍼런스 리소스를 만듭니다."""
+
+    resources = {
+        "examples": CrawlingDataResource(
+            uri="strands://examples",
+            name="examples",
+            title="Strands Agent 예시 목록",
+            mime_type="text/markdown",
+            text=STRANDS_EXAMPLES_OVERVIEW,
+            summary="크롤링한 실제 Strands Agent 애플리케이션 예시 목록"
+        )
+    }
+
+    for key, (uri, filename, title) in CRAWLING_DATA_FILES.items():
+        resources[key] = CrawlingDataResource(
+            uri=uri,
+            name=key,
+            title=title,
+            mime_type="text/markdown",
+            path=Path(CRAWLING_DATA_PATH) / filename,
+            summary=title
+        )
+
+    for resource in resources.values():
+        try:
+            resource.refresh()
+        except Exception as e:
+            print(f"데이터 로드 오류: {e}")
+
+    return resources
+
+
+def refresh_crawling_resources() -> List[CrawlingDataResource]:
+    """모든 리소스의 원본을 확인하고 바뀐 리소스 목록을 반환합니다."""
+
+    global _example_index
+
+    changed = []
+    # 도구 스레드와 감시 작업이 동시에 갱신하지 않도록 직렬화합니다
+    with _resource_refresh_lock:
+        for resource in crawling_resources.values():
+            try:
+                if resource.refresh():
+                    changed.append(resource)
+            except Exception as e:
+                print(f"데이터 로드 오류: {e}")
+
+    # 샘플이 바뀌면 예시 검색 인덱스를 다음 사용 시 다시 만듭니다
+    if any(resource.name == "samples" for resource in changed):
+        _example_index = None
+
+    return changed
+
+
+async def notify_resource_changes(changed: List[CrawlingDataResource]) -> None:
+    """
+    바뀐 리소스를 구독한 세션에 resources/updated를, 목록을 조회한 세션에
+    resources/list_changed를 보냅니다 (strands://index 구독자는 모든 변경을 받습니다).
+    """
+
+    uris = [str(resource.uri) for resource in changed] + [RESOURCE_INDEX_URI]
+    for uri in uris:
+        for session in list(_resource_subscriptions.get(uri, ())):
+            try:
+                await session.send_resource_updated(AnyUrl(uri))
+            except Exception:
+                for sessions in _resource_subscriptions.values():
+                    sessions.discard(session)
+
+    for session in list(_resource_list_sessions):
+        try:
+            await session.send_resource_list_changed()
+        except Exception:
+            _resource_list_sessions.discard(session)
+
+
+async def watch_crawling_data() -> None:
+    """크롤링 데이터 파일을 주기적으로 확인하고 변경 시 리소스 변경 알림을 보냅니다."""
+
+    # 도구 호출이 먼저 갱신한 변경도 놓치지 않도록 마지막으로 알린 해시와 비교합니다
+    notified = {str(resource.uri): resource.sha256 for resource in crawling_resources.values()}
+    while True:
+        await asyncio.sleep(RESOURCE_POLL_INTERVAL_S)
+        await asyncio.to_thread(refresh_crawling_resources)
+        changed = [
+            resource for resource in crawling_resources.values()
+            if notified.get(str(resource.uri)) != resource.sha256
+        ]
+        if not changed:
+            continue
+
+        for resource in changed:
+            notified[str(resource.uri)] = resource.sha256
+        await notify_resource_changes(changed)
+
+
+@asynccontextmanager
+async def crawling_data_lifespan(server: Any) -> AsyncIterator[None]:
+    """서버가 실행되는 동안 크롤링 데이터 변경 감시 작업을 유지합니다."""
+
+    global _resource_watcher, _resource_watcher_users
+
+    _resource_watcher_users += 1
+    if _resource_watcher is None or _resource_watcher.done():
+        _resource_watcher = asyncio.create_task(watch_crawling_data())
+
+    try:
+        yield
+    finally:
+        _resource_watcher_users -= 1
+        if _resource_watcher_users == 0 and _resource_watcher is not None:
+            _resource_watcher.cancel()
+            _resource_watcher = None
+
+class StrandsMCP(FastMCP):
+    """
+    리소스 구독을 지원하는 FastMCP 서버
+
+    resources/subscribe·unsubscribe로 URI별 구독 세션을 관리하고, 리소스 목록에
+    파일 크기를 채우며, 초기화 시 resources의 subscribe/listChanged 기능을 알립니다.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._mcp_server.subscribe_resource()(self.subscribe_resource)
+        self._mcp_server.unsubscribe_resource()(self.unsubscribe_resource)
+
+        create_options = self._mcp_server.create_initialization_options
+
+        def create_initialization_options(
+            notification_options: Optional[NotificationOptions] = None,
+            experimental_capabilities: Optional[Dict[str, Dict[str, Any]]] = None
+        ) -> Any:
+            options = create_options(
+                notification_options or NotificationOptions(resources_changed=True),
+                experimental_capabilities
+            )
+            # 저수준 서버는 구독 처리기가 있어도 subscribe를 항상 False로 알립니다
+            if options.capabilities.resources is not None:
+                options.capabilities.resources.subscribe = True
+            return options
+
+        self._mcp_server.create_initialization_options = create_initialization_options
+
+    async def list_resources(self) -> List[MCPResource]:
+        """리소스 목록에 크기를 채우고, 조회한 세션을 목록 변경 알림 대상으로 등록합니다."""
+
+        try:
+            _resource_list_sessions.add(self._mcp_server.request_context.session)
+        except LookupError:
+            pass  # 요청 컨텍스트 밖에서 호출된 경우
+
+        sizes = {
+            str(resource.uri): resource.size
+            for resource in crawling_resources.values() if resource.exists
+        }
+        return [
+            resource.model_copy(update={"size": sizes.get(str(resource.uri))})
+            for resource in await super().list_resources()
+        ]
+
+    async def read_resource(self, uri: Any) -> List[ReadResourceContents]:
+        """
+        크롤링 리소스는 직접 읽어 원본이 없을 때의 리소스 없음(-32002) 오류를 그대로
+        전달합니다 (FastMCP 기본 구현은 모든 예외를 일반 오류로 바꿉니다).
+        """
+
+        for resource in crawling_resources.values():
+            if str(resource.uri) == str(uri):
+                text = await resource.read()
+                return [
+                    ReadResourceContents(content=text, mime_type=resource.mime_type)
+                ]
+        return list(await super().read_resource(uri))
+
+    async def subscribe_resource(self, uri: AnyUrl) -> None:
+        """요청한 세션을 해당 URI의 변경 알림 대상으로 등록합니다."""
+
+        uri = str(uri)
+        if uri not in resource_uris():
+            raise ValueError(f"알 수 없는 리소스입니다: {uri}")
+        session = self._mcp_server.request_context.session
+        _resource_subscriptions.setdefault(uri, weakref.WeakSet()).add(session)
+
+    async def unsubscribe_resource(self, uri: AnyUrl) -> None:
+        """요청한 세션의 해당 URI 구독을 해제합니다."""
+
+        sessions = _resource_subscriptions.get(str(uri))
+        if sessions is not None:
+            sessions.discard(self._mcp_server.request_context.session)
+
+
+def resource_uris() -> List[str]:
+    """구독할 수 있는 strands:// 리소스 URI 목록"""
+
+    return [str(resource.uri) for resource in crawling_resources.values()] + [RESOURCE_INDEX_URI]
+
+
+mcp = StrandsMCP(
     "strands-agent-generator",
+    lifespan=crawling_data_lifespan,
     instructions="""
     Strands Agent 자동 생성 MCP 서버입니다.
     
@@ -30,32 +542,161 @@ mcp = FastMCP(
     - AWS 서비스 자동 통합
     - 실제 동작하는 완전한 프로젝트 구조 제공
     - 배포 설정 자동 생성
+    
+    예시, 가이드, 샘플, API 레퍼런스는 strands:// 리소스로도 제공되며
+    구독한 리소스의 원본이 바뀌면 변경 알림을 보냅니다. 목록과 해시: strands://index
     """
 )
 
+crawling_resources = build_crawling_resources()
+for crawling_resource in crawling_resources.values():
+    mcp.add_resource(crawling_resource)
+
+
+@mcp.resource(
+    RESOURCE_INDEX_URI,
+    name="index",
+    title="Strands 리소스 목록",
+    mime_type="application/json"
+)
+def get_resource_index() -> str:
+    """모든 strands:// 리소스의 URI, 크기, sha256 목록"""
+    return json.dumps(
+        [resource.info() for resource in crawling_resources.values()],
+        ensure_ascii=False
+    )
+
 
 def load_crawling_data() -> Dict[str, str]:
-    """크롤링한 데이터를 로드합니다."""
-    data = {}
-    
-    try:
-        # 가이드 문서들 로드
-        guide_path = Path(CRAWLING_DATA_PATH) / "strands-comprehensive-guide.md"
-        if guide_path.exists():
-            data["guide"] = guide_path.read_text(encoding='utf-8')
-        
-        samples_path = Path(CRAWLING_DATA_PATH) / "strands-samples-collection.md"
-        if samples_path.exists():
-            data["samples"] = samples_path.read_text(encoding='utf-8')
-            
-        api_path = Path(CRAWLING_DATA_PATH) / "strands-api-reference.md"
-        if api_path.exists():
-            data["api"] = api_path.read_text(encoding='utf-8')
-            
-    except Exception as e:
-        print(f"데이터 로드 오류: {e}")
-    
-    return data
+    """크롤링한 데이터를 로드합니다 (바뀐 파일만 다시 읽는 리소스 캐시 사용)."""
+    refresh_crawling_resources()
+
+    return {
+        key: crawling_resources[key].text
+        for key in CRAWLING_DATA_FILES
+        if crawling_resources[key].exists
+    }
+
+
+def split_samples(markdown: str) -> List[Dict[str, str]]:
+    """샘플 모음 마크다운을 `##`/`###` 제목 단위의 예시로 나눕니다."""
+
+    examples = []
+    title = None
+    body: List[str] = []
+
+    def flush() -> None:
+        text = "\n".join(body).strip()
+        if title and text:
+            examples.append({"title": title, "body": text})
+
+    for line in markdown.splitlines():
+        match = re.match(r"^#{2,3}\s+(.+)$", line)
+        if match:
+            flush()
+            title = match.group(1).strip()
+            body = []
+        else:
+            body.append(line)
+    flush()
+
+    return examples
+
+
+def hash_features(text: str) -> np.ndarray:
+    """단어와 단어 내부 문자 2/3-gram을 해시 버킷 번호로 변환합니다."""
+
+    features = []
+    for word in re.findall(r"\w+", text.lower()):
+        features.append(word)
+        padded = f" {word} "
+        for size in (2, 3):
+            features.extend(padded[i:i + size] for i in range(len(padded) - size + 1))
+
+    return np.fromiter(
+        (zlib.crc32(feature.encode("utf-8")) for feature in features),
+        dtype=np.uint32,
+        count=len(features)
+    ) % EXAMPLE_HASH_DIM
+
+
+class ExampleIndex:
+    """샘플 예시의 해시 n-gram TF-IDF 행렬 (행 단위 L2 정규화)"""
+
+    def __init__(self, examples: List[Dict[str, str]]) -> None:
+        self.examples = examples
+        self.matrix = np.zeros((len(examples), EXAMPLE_HASH_DIM), dtype=np.float32)
+        self.idf = np.ones(EXAMPLE_HASH_DIM, dtype=np.float32)
+
+        if not examples:
+            return
+
+        buckets = [hash_features(f"{e['title']} {e['title']} {e['body']}") for e in examples]
+        rows = np.repeat(np.arange(len(examples)), [len(b) for b in buckets])
+        np.add.at(self.matrix, (rows, np.concatenate(buckets)), 1.0)
+
+        document_frequency = np.count_nonzero(self.matrix, axis=0)
+        self.idf = (np.log((1 + len(examples)) / (1 + document_frequency)) + 1).astype(np.float32)
+        self.matrix = np.log1p(self.matrix) * self.idf
+        norms = np.linalg.norm(self.matrix, axis=1, keepdims=True)
+        self.matrix /= np.where(norms == 0, 1, norms)
+
+    def search(self, query: str, limit: int = 3) -> List[Dict[str, Any]]:
+        """질의와 코사인 유사도가 가장 높은 예시를 반환합니다."""
+
+        if not self.examples or not query.strip():
+            return []
+
+        vector = np.bincount(hash_features(query), minlength=EXAMPLE_HASH_DIM)
+        vector = np.log1p(vector.astype(np.float32)) * self.idf
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return []
+
+        scores = self.matrix @ (vector / norm)
+        limit = min(limit, len(scores))
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top])]
+
+        return [
+            {
+                "title": self.examples[i]["title"],
+                "score": round(float(scores[i]), 4),
+                "excerpt": self.examples[i]["body"][:EXAMPLE_EXCERPT_CHARS]
+            }
+            for i in top if scores[i] > 0
+        ]
+
+
+def get_example_index() -> ExampleIndex:
+    """샘플 모음 인덱스를 한 번만 만들어 재사용합니다."""
+
+    global _example_index
+
+    if _example_index is None:
+        samples = load_crawling_data().get("samples", "")
+        _example_index = ExampleIndex(split_samples(samples))
+    return _example_index
+
+
+def select_examples(requirements: str, limit: int = 3) -> List[Dict[str, Any]]:
+    """요구사항과 가장 가까운 실제 샘플 예시를 고릅니다."""
+
+    return get_example_index().search(requirements, limit)
+
+
+def summarize_example(excerpt: str) -> str:
+    """예시 발췌에서 코드 블록 밖의 첫 설명 줄을 요약으로 사용합니다."""
+
+    in_code = False
+    for line in excerpt.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            in_code = not in_code
+            continue
+        if stripped and not in_code:
+            return stripped.lstrip("-*> ")[:EXAMPLE_SUMMARY_CHARS]
+    return ""
 
 
 def analyze_requirements(requirements: str) -> Dict[str, Any]:
@@ -107,8 +748,8 @@ def analyze_requirements(requirements: str) -> Dict[str, Any]:
     return analysis
 
 
-def generate_basic_agent(requirements: str, analysis: Dict[str, Any]) -> str:
-    """기본 에이전트 코드를 생성합니다."""
+def build_tool_sections(analysis: Dict[str, Any]) -> Dict[str, List[str]]:
+    """분석 결과로부터 AWS 클라이언트와 도구 정의 코드 조각을 생성합니다."""
     
     aws_services = analysis["aws_services"]
     tools_needed = analysis["tools_needed"]
@@ -194,323 +835,2013 @@ def process_request(request: str) -> str:
     return f"요청 '{request}'를 처리했습니다."
 ''')
     tools_list.append("process_request")
-    
-    # 코드 템플릿 생성
-    code = f'''"""
-{requirements}를 위한 Strands Agent
 
-자동 생성된 코드입니다.
-생성 시간: {datetime.now().isoformat()}
-"""
+    return {
+        "aws_imports": aws_imports,
+        "aws_clients": aws_clients,
+        "tools_code": tools_code,
+        "tools_list": tools_list,
+        "builtin_tools": builtin_tools
+    }
 
-from strands import Agent
-from strands.models import BedrockModel
-from strands.tools import tool
-{chr(10).join(aws_imports)}
-{f"from strands_tools import {', '.join(builtin_tools)}" if builtin_tools else ""}
 
-# AWS 클라이언트 초기화
+def build_model_code(analysis: Dict[str, Any]) -> str:
+    """에이전트 타입별 토큰 예산과 캐싱 옵션을 반영한 BedrockModel 생성 코드"""
+
+    agent_type = analysis.get("agent_type", "basic")
+    options = [
+        'model_id="anthropic.claude-3-5-sonnet-20241022-v2:0"',
+        'region="us-west-2"',
+        f"max_tokens={AGENT_MAX_TOKENS.get(agent_type, AGENT_MAX_TOKENS['basic'])}",
+        "temperature=0.7"
+    ]
+
+    # 시스템 프롬프트와 도구 정의 뒤에 캐시 포인트를 두어 반복 턴에서 재사용
+    if analysis.get("prompt_caching"):
+        options.append('cache_prompt="default"')
+        options.append('cache_tools="default"')
+
+    return "BedrockModel(\n" + ",\n".join(f"    {option}" for option in options) + "\n)"
+
+
+def system_prompt_lines(requirements: str, analysis: Dict[str, Any]) -> List[str]:
+    """
+    에이전트 타입에 맞는 시스템 프롬프트를 줄 단위로 생성합니다.
+
+    프롬프트 캐싱을 사용하면 도구 정의와 중복되는 도구 목록을 빼고
+    서비스 목록을 정렬하여, 같은 입력에 대해 항상 같은 프롬프트가 되도록 합니다.
+    """
+
+    agent_type = analysis.get("agent_type", "basic")
+    trimmed = analysis.get("prompt_caching", False)
+    references = reference_prompt_lines(analysis.get("reference_examples", []), trimmed)
+
+    if agent_type == "multi_agent":
+        if trimmed:
+            return [
+                f"당신은 {requirements}를 위한 마스터 코디네이터입니다.",
+                *references,
+                "전문 에이전트 도구로 작업을 분석, 처리, 검증하여 최고의 결과를 제공하세요."
+            ]
+        return [
+            f"당신은 {requirements}를 위한 마스터 코디네이터입니다.",
+            "",
+            "여러 전문 에이전트를 조율하여 복잡한 작업을 효율적으로 처리하세요:",
+            "- coordinator_agent: 작업 분석 및 할당",
+            "- processor_agent: 데이터 처리 및 분석",
+            "- validator_agent: 결과 검증 및 품질 보장",
+            "",
+            *references,
+            "각 에이전트의 전문성을 활용하여 최고의 결과를 제공하세요."
+        ]
+
+    if agent_type == "conversational":
+        role = "대화형 AI 어시스턴트"
+        guidance = "이전 대화 맥락을 고려하여 간결하고 정확하게 답변하고, 필요시 적절한 도구를 사용하세요."
+    else:
+        role = "전문 AI 어시스턴트"
+        guidance = "항상 도움이 되고 정확한 정보를 제공하며, 필요시 적절한 도구를 사용하세요."
+
+    if trimmed:
+        return [
+            f"당신은 {requirements}를 위한 {role}입니다.",
+            f"사용 가능한 AWS 서비스: {', '.join(sorted(analysis['aws_services']))}",
+            *references,
+            guidance
+        ]
+
+    sections = build_tool_sections(analysis)
+    return [
+        f"당신은 {requirements}를 위한 {role}입니다.",
+        "",
+        f"사용 가능한 AWS 서비스: {', '.join(analysis['aws_services'])}",
+        f"사용 가능한 도구: {', '.join(sections['tools_list'] + sections['builtin_tools'])}",
+        "",
+        *references,
+        guidance
+    ]
+
+
+def reference_prompt_lines(examples: List[Dict[str, str]], trimmed: bool = False) -> List[str]:
+    """
+    요구사항과 가까운 실제 샘플을 시스템 프롬프트에 넣을 줄로 만듭니다.
+
+    축약 프롬프트(프롬프트 캐싱)에는 제목만 한 줄로 넣습니다.
+    """
+
+    if not examples:
+        return []
+    if trimmed:
+        return [f"참고 샘플: {', '.join(example['title'] for example in examples)}"]
+    return [
+        "다음 실제 Strands 샘플과 비슷한 방식으로 작업을 처리하세요:",
+        *(
+            f"- {example['title']}: {example['summary']}" if example.get("summary")
+            else f"- {example['title']}"
+            for example in examples
+        ),
+        ""
+    ]
+
+
+def python_literal(text: str) -> str:
+    """사용자 입력을 생성 코드에 넣을 수 있는 문자열 리터럴로 변환합니다."""
+    return json.dumps(text, ensure_ascii=False)
+
+
+def docstring_text(text: str) -> str:
+    """사용자 입력을 생성 코드의 docstring 안에 안전하게 넣도록 이스케이프합니다."""
+    return text.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def render_system_prompt(lines: List[str]) -> str:
+    """프롬프트 줄들을 들여쓰기에 영향받지 않는 문자열 리터럴 코드로 변환합니다."""
+
+    literals = [python_literal(line + "\n") for line in lines[:-1]]
+    literals.append(python_literal(lines[-1]))
+    return "(\n" + "\n".join(f"    {literal}" for literal in literals) + "\n)"
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수를 추정합니다 (ASCII 약 4자당 1토큰, 한글 등은 1자당 1토큰)."""
+
+    ascii_chars = sum(1 for char in text if char.isascii())
+    return -(-ascii_chars // 4) + (len(text) - ascii_chars)
+
+
+def estimate_prompt_tokens(main_code: str, prompt_caching: bool = False) -> Dict[str, Any]:
+    """
+    생성된 코드에서 호출마다 전송되는 프롬프트 토큰 수를 추정합니다.
+
+    `SYSTEM_PROMPT`와 `@tool` 함수의 이름/인자/docstring, `strands_tools` 내장
+    도구를 기준으로 계산합니다.
+    """
+
+    tree = ast.parse(main_code)
+    system_tokens = 0
+    tool_tokens = 0
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "SYSTEM_PROMPT"
+            for target in node.targets
+        ):
+            system_tokens = estimate_tokens(ast.literal_eval(node.value))
+        elif isinstance(node, ast.FunctionDef) and any(
+            isinstance(decorator, ast.Name) and decorator.id == "tool"
+            for decorator in node.decorator_list
+        ):
+            spec = f"{node.name}({ast.unparse(node.args)}) {ast.get_docstring(node) or ''}"
+            tool_tokens += TOOL_SPEC_BASE_TOKENS + estimate_tokens(spec)
+        elif isinstance(node, ast.ImportFrom) and node.module == "strands_tools":
+            tool_tokens += BUILTIN_TOOL_SPEC_TOKENS * len(node.names)
+
+    total = system_tokens + tool_tokens
+    return {
+        "system_prompt": system_tokens,
+        "tool_specs": tool_tokens,
+        "per_call_estimate": total,
+        "prompt_caching": prompt_caching,
+        "cacheable": total >= PROMPT_CACHE_MIN_TOKENS
+    }
+
+
+def generate_basic_agent(requirements: str, analysis: Dict[str, Any]) -> str:
+    """기본 에이전트 코드를 생성합니다."""
+
+    aws_services = analysis["aws_services"]
+    sections = build_tool_sections(analysis)
+    aws_imports = sections["aws_imports"]
+    aws_clients = sections["aws_clients"]
+    tools_code = sections["tools_code"]
+    tools_list = sections["tools_list"]
+    builtin_tools = sections["builtin_tools"]
+
+    # 에이전트 구성 코드 (클라이언트, 도구, 모델은 공유하고 에이전트는 대화마다 생성)
+    setup = f'''# AWS 클라이언트 초기화
 {chr(10).join(aws_clients)}
 
 # 도구 정의
 {chr(10).join(tools_code)}
 
 # 에이전트 설정
-model = BedrockModel(
-    model_id="anthropic.claude-3-5-sonnet-20241022-v2:0",
-    region="us-west-2",
-    max_tokens=2000,
-    temperature=0.7
-)
+model = {build_model_code(analysis)}
 
-agent = Agent(
-    model=model,
-    tools=[{', '.join(tools_list)}{', ' + ', '.join(builtin_tools) if builtin_tools else ''}],
-    system_prompt="""
-당신은 {requirements}를 위한 전문 AI 어시스턴트입니다.
+SYSTEM_PROMPT = {render_system_prompt(system_prompt_lines(requirements, analysis))}
 
-사용 가능한 AWS 서비스: {', '.join(aws_services)}
-사용 가능한 도구: {', '.join(tools_list + builtin_tools)}
+TOOLS = [{', '.join(tools_list + builtin_tools)}]
 
-항상 도움이 되고 정확한 정보를 제공하며, 필요시 적절한 도구를 사용하세요.
-"""
-)
 
-def main():
+def create_agent(messages: Optional[List[Dict[str, Any]]] = None) -> Agent:
+    """대화 기록(messages)을 가진 새 에이전트를 생성합니다 (없으면 새 대화)."""
+    return Agent(
+        model=model,
+        tools=TOOLS,
+        messages=messages,
+        system_prompt=SYSTEM_PROMPT
+    )
+'''
+
+    imports = [
+        "from strands import Agent",
+        "from strands.models import BedrockModel",
+        "from strands.tools import tool",
+    ] + aws_imports
+    if builtin_tools:
+        imports.append(f"from strands_tools import {', '.join(builtin_tools)}")
+
+    local_main = f'''def main():
     """메인 실행 함수"""
     try:
         print("🤖 Strands Agent가 시작되었습니다!")
-        print(f"목적: {requirements}")
-        print(f"사용 가능한 AWS 서비스: {', '.join(aws_services)}")
-        
+        print("목적:", {python_literal(requirements)})
+        print("사용 가능한 AWS 서비스:", {python_literal(', '.join(aws_services))})
+
         # 테스트 실행
+        agent = create_agent()
         response = agent("안녕하세요! 어떻게 도와드릴까요?")
-        print(f"응답: {response}")
-        
+        print(f"응답: {{response}}")
+
         return response
     except Exception as e:
-        print(f"오류 발생: {e}")
+        print(f"오류 발생: {{e}}")
         return None
-
-if __name__ == "__main__":
-    main()
 '''
-    
-    return code
+
+    return render_agent_module(
+        f"{requirements}를 위한 Strands Agent",
+        imports,
+        setup,
+        local_main,
+        analysis,
+    )
 
 
 def generate_multi_agent(requirements: str, analysis: Dict[str, Any]) -> str:
     """멀티 에이전트 시스템 코드를 생성합니다."""
-    
-    code = f'''"""
-{requirements}를 위한 멀티 에이전트 시스템
 
-자동 생성된 코드입니다.
-생성 시간: {datetime.now().isoformat()}
-"""
+    setup = f'''# 전문 에이전트 (모델 클라이언트는 공유하고 에이전트는 풀에서 빌려 사용)
+specialist_model = BedrockModel(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0")
 
-from strands import Agent
-from strands.models import BedrockModel
-from strands.tools import tool
-import boto3
 
-# 전문화된 에이전트들을 도구로 정의
-@tool
-def coordinator_agent(task: str) -> str:
-    """작업을 조율하는 코디네이터 에이전트"""
-    agent = Agent(
-        model=BedrockModel(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0"),
-        system_prompt="당신은 작업을 분석하고 적절한 전문가에게 할당하는 코디네이터입니다."
-    )
-    return agent(task)
+class Specialist:
+    """
+    작업마다 빈 대화로 호출되는 전문 에이전트 풀
+
+    쉬고 있는 에이전트를 빌려 쓰고 반납하며, 모두 사용 중이면 새로 만들므로
+    동시 요청이 서로를 기다리지 않습니다.
+    """
+
+    def __init__(self, system_prompt: str) -> None:
+        self.system_prompt = system_prompt
+        self.idle: "queue.SimpleQueue[Agent]" = queue.SimpleQueue()
+
+    def __call__(self, task: str) -> str:
+        try:
+            agent = self.idle.get_nowait()
+        except queue.Empty:
+            agent = Agent(
+                model=specialist_model,
+                system_prompt=self.system_prompt,
+                callback_handler=None
+            )
+        try:
+            # 이전 작업의 대화가 섞이지 않도록 기록을 비웁니다
+            agent.messages = []
+            return str(agent(task))
+        finally:
+            self.idle.put(agent)
+
+
+coordinator = Specialist("당신은 작업을 분석하고 적절한 전문가에게 할당하는 코디네이터입니다.")
+processor = Specialist("당신은 데이터 처리 및 분석 전문가입니다.")
+validator = Specialist("당신은 결과를 검증하고 품질을 보장하는 전문가입니다.")
+
+
+# 전문 에이전트들을 도구로 정의
+@tool
+def coordinator_agent(task: str) -> str:
+    """작업을 조율하는 코디네이터 에이전트"""
+    return coordinator(task)
 
 @tool
 def processor_agent(task: str) -> str:
     """데이터 처리 전문 에이전트"""
-    agent = Agent(
-        model=BedrockModel(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0"),
-        system_prompt="당신은 데이터 처리 및 분석 전문가입니다."
+    return processor(task)
+
+@tool
+def validator_agent(task: str) -> str:
+    """검증 전문 에이전트"""
+    return validator(task)
+
+# 마스터 에이전트 (오케스트레이터)
+model = {build_model_code(analysis)}
+
+SYSTEM_PROMPT = {render_system_prompt(system_prompt_lines(requirements, analysis))}
+
+TOOLS = [coordinator_agent, processor_agent, validator_agent]
+
+
+def create_agent(messages: Optional[List[Dict[str, Any]]] = None) -> Agent:
+    """대화 기록(messages)을 가진 새 마스터 에이전트를 생성합니다 (없으면 새 대화)."""
+    return Agent(
+        model=model,
+        tools=TOOLS,
+        messages=messages,
+        system_prompt=SYSTEM_PROMPT
+    )
+'''
+
+    imports = [
+        "import queue",
+        "",
+        "from strands import Agent",
+        "from strands.models import BedrockModel",
+        "from strands.tools import tool",
+    ]
+
+    local_main = f'''def main():
+    """메인 실행 함수"""
+    try:
+        print("🤖 멀티 에이전트 시스템이 시작되었습니다!")
+        print("목적:", {python_literal(requirements)})
+
+        # 테스트 실행
+        master_agent = create_agent()
+        response = master_agent("복잡한 작업을 처리해주세요")
+        print(f"응답: {{response}}")
+
+        return response
+    except Exception as e:
+        print(f"오류 발생: {{e}}")
+        return None
+'''
+
+    return render_agent_module(
+        f"{requirements}를 위한 멀티 에이전트 시스템",
+        imports,
+        setup,
+        local_main,
+        analysis,
     )
-    return agent(task)
 
-@tool
-def validator_agent(task: str) -> str:
-    """검증 전문 에이전트"""
-    agent = Agent(
-        model=BedrockModel(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0"),
-        system_prompt="당신은 결과를 검증하고 품질을 보장하는 전문가입니다."
+
+def generate_conversational_agent(requirements: str, analysis: Dict[str, Any]) -> str:
+    """스트리밍 응답과 제한된 대화 창을 갖는 대화형 에이전트 코드를 생성합니다."""
+
+    sections = build_tool_sections(analysis)
+    tools_list = sections["tools_list"]
+    builtin_tools = sections["builtin_tools"]
+
+    setup = f'''# AWS 클라이언트 초기화
+{chr(10).join(sections["aws_clients"])}
+
+# 도구 정의
+{chr(10).join(sections["tools_code"])}
+
+class WindowedSummarizingConversationManager(SummarizingConversationManager):
+    """메시지 수가 창 크기를 넘으면 오래된 턴을 요약하는 대화 관리자"""
+
+    def __init__(self, window_size: int, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.window_size = window_size
+
+    def apply_management(self, agent: Agent, **kwargs: Any) -> None:
+        """매 턴 이후 대화 길이를 창 크기 이내로 유지합니다."""
+        if len(agent.messages) > self.window_size:
+            self.reduce_context(agent)
+
+
+# 에이전트 설정
+model = {build_model_code(analysis)}
+
+SYSTEM_PROMPT = {render_system_prompt(system_prompt_lines(requirements, analysis))}
+
+TOOLS = [{', '.join(tools_list + builtin_tools)}]
+
+
+def create_agent(messages: Optional[List[Dict[str, Any]]] = None) -> Agent:
+    """대화 기록(messages)을 가진 새 에이전트를 생성합니다 (없으면 새 대화)."""
+    # 최근 메시지는 그대로 유지하고 그 이전 턴은 요약으로 대체하여
+    # 긴 세션에서도 메모리와 토큰 사용량을 일정하게 유지합니다.
+    conversation_manager = WindowedSummarizingConversationManager(
+        window_size={CONVERSATION_WINDOW_MESSAGES},
+        summary_ratio=0.5,
+        preserve_recent_messages={CONVERSATION_PRESERVED_MESSAGES}
+    )
+    return Agent(
+        model=model,
+        tools=TOOLS,
+        messages=messages,
+        conversation_manager=conversation_manager,
+        callback_handler=None,
+        system_prompt=SYSTEM_PROMPT
+    )
+'''
+
+    imports = [
+        "import asyncio",
+        "",
+        "from strands import Agent",
+        "from strands.agent.conversation_manager import "
+        "SummarizingConversationManager",
+        "from strands.models import BedrockModel",
+        "from strands.tools import tool",
+    ] + sections["aws_imports"]
+    if builtin_tools:
+        imports.append(f"from strands_tools import {', '.join(builtin_tools)}")
+
+    local_main = f'''async def stream_reply(agent: Agent, prompt: str) -> str:
+    """응답을 토큰 단위로 출력하고 전체 응답을 반환합니다."""
+    chunks = []
+    async for event in agent.stream_async(prompt):
+        text = event.get("data")
+        if text:
+            print(text, end="", flush=True)
+            chunks.append(text)
+    print()
+    return "".join(chunks)
+
+
+async def chat() -> None:
+    """사용자 입력을 받아 스트리밍으로 응답하는 대화 루프"""
+    print("🤖 대화형 Strands Agent가 시작되었습니다! (종료: exit)")
+    print("목적:", {python_literal(requirements)})
+    agent = create_agent()
+
+    while True:
+        try:
+            user_input = await asyncio.to_thread(input, "\\n👤 ")
+        except (EOFError, KeyboardInterrupt):
+            break
+
+        user_input = user_input.strip()
+        if not user_input:
+            continue
+        if user_input.lower() in ("exit", "quit", "종료"):
+            break
+
+        print("🤖 ", end="", flush=True)
+        try:
+            await stream_reply(agent, user_input)
+        except Exception as e:
+            print(f"\\n오류 발생: {{e}}")
+
+
+def main():
+    """메인 실행 함수"""
+    asyncio.run(chat())
+'''
+
+    return render_agent_module(
+        f"{requirements}를 위한 대화형 Strands Agent",
+        imports,
+        setup,
+        local_main,
+        analysis,
+    )
+
+
+def render_agent_module(
+    title: str,
+    imports: List[str],
+    setup: str,
+    local_main: str,
+    analysis: Dict[str, Any]
+) -> str:
+    """
+    에이전트 구성 코드를 배포 대상에 맞는 완전한 모듈로 조립합니다.
+
+    구성 코드는 모델, 클라이언트, 도구를 만들고 `create_agent(messages)` 팩토리를 정의합니다.
+    Lambda 대상이면 import와 구성 코드를 `_build_agent_factory()` 안으로 옮겨 컨테이너당
+    한 번만 수행하고, 요청마다 새 에이전트를 만들어 `session_id`별 대화 기록만 이어주는
+    `handler()`를 생성합니다. 대화형 에이전트는 Lambda Web Adapter의 응답 스트리밍으로
+    `stream_async` 토큰을 그대로 전달하는 ASGI `app`도 함께 생성합니다.
+    """
+
+    header = f'''"""
+{docstring_text(title)}
+
+자동 생성된 코드입니다.
+생성 시간: {analysis.get("generated_at") or datetime.now().isoformat()}
+"""
+'''
+
+    if analysis.get("deployment") != "lambda":
+        return f'''{header}
+from typing import Any, Dict, List, Optional
+
+{chr(10).join(imports)}
+
+{setup}
+
+{local_main}
+
+if __name__ == "__main__":
+    main()
+'''
+
+    build_body = textwrap.indent(
+        f"{chr(10).join(imports)}\n\n{setup}\nreturn create_agent\n", "    "
+    )
+
+    streaming_app = ""
+    if analysis.get("agent_type") == "conversational":
+        streaming_app = '''
+
+async def _send_text(send: Callable[..., Any], status: int, text: str) -> None:
+    """버퍼링된 텍스트 응답을 보냅니다."""
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"text/plain; charset=utf-8")]
+    })
+    await send({"type": "http.response.body", "body": text.encode("utf-8")})
+
+
+async def app(
+    scope: Dict[str, Any],
+    receive: Callable[..., Any],
+    send: Callable[..., Any]
+) -> None:
+    """
+    Lambda Web Adapter(응답 스트리밍)로 실행되는 ASGI 앱
+
+    run.sh가 uvicorn으로 `main:app`을 띄우며, POST 본문의 prompt에 대한 응답을
+    `stream_async` 토큰 단위로 바로 전달합니다.
+    """
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    if scope["type"] != "http":
+        return
+
+    # Lambda Web Adapter의 준비 상태 확인 (GET /)
+    if scope["method"] != "POST":
+        await _send_text(send, 200, "ok")
+        return
+
+    body = b""
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+    try:
+        prompt, session_id = _parse_event({"body": body.decode("utf-8")})
+    except (ValueError, TypeError, AttributeError):
+        await _send_text(send, 400, "요청 본문이 올바른 JSON이 아닙니다.")
+        return
+    if not prompt:
+        await _send_text(send, 400, "prompt가 비어있습니다.")
+        return
+
+    headers = [(b"content-type", b"text/plain; charset=utf-8")]
+    if session_id:
+        headers.append((b"x-session-id", session_id.encode("utf-8")))
+    await send({"type": "http.response.start", "status": 200, "headers": headers})
+
+    try:
+        agent = get_agent(session_id)
+        async for event in agent.stream_async(prompt):
+            text = event.get("data")
+            if text:
+                await send({
+                    "type": "http.response.body",
+                    "body": text.encode("utf-8"),
+                    "more_body": True
+                })
+        save_session(session_id, agent)
+    except Exception as e:
+        # 상태 코드는 이미 전송되었으므로 오류는 본문 끝에 덧붙입니다
+        await send({
+            "type": "http.response.body",
+            "body": f"\\n[오류] {e}".encode("utf-8"),
+            "more_body": True
+        })
+    await send({"type": "http.response.body", "body": b""})
+'''
+
+    return f'''{header}
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 컨테이너가 메모리에 보관하는 최대 세션 수 (가장 오래 사용되지 않은 세션부터 제거)
+MAX_SESSIONS = {LAMBDA_MAX_SESSIONS}
+
+# 컨테이너 단위로 재사용되는 에이전트 팩토리 (콜드 스타트 시 한 번만 생성)
+_create_agent = None
+# session_id별 대화 기록 (최근 사용 순)
+_sessions: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+
+
+def _build_agent_factory() -> Callable[..., Any]:
+    """AWS 클라이언트, 도구, 모델을 생성하고 에이전트 팩토리를 반환합니다."""
+{build_body}
+
+def get_agent_factory() -> Callable[..., Any]:
+    """에이전트 팩토리를 최초 호출 시 생성하고 이후에는 재사용합니다."""
+    global _create_agent
+    if _create_agent is None:
+        _create_agent = _build_agent_factory()
+    return _create_agent
+
+
+def get_agent(session_id: Optional[str] = None) -> Any:
+    """
+    요청마다 새 에이전트를 생성합니다.
+
+    session_id가 있으면 이 컨테이너에 보관된 해당 세션의 대화 기록을 이어가고,
+    없으면 다른 요청의 대화가 섞이지 않도록 빈 대화로 시작합니다.
+    """
+    messages = _sessions.pop(session_id, None) if session_id else None
+    return get_agent_factory()(messages)
+
+
+def save_session(session_id: Optional[str], agent: Any) -> None:
+    """응답 후 대화 기록을 session_id로 보관합니다."""
+    if not session_id:
+        return
+    _sessions[session_id] = agent.messages
+    while len(_sessions) > MAX_SESSIONS:
+        _sessions.popitem(last=False)
+
+
+def _response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
+    """Lambda 프록시 응답 형식으로 변환합니다."""
+    return {{
+        "statusCode": status_code,
+        "headers": {{"Content-Type": "application/json"}},
+        "body": json.dumps(body, ensure_ascii=False)
+    }}
+
+
+def _parse_event(event: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    """직접 호출 이벤트 또는 API Gateway 이벤트에서 프롬프트와 session_id를 추출합니다."""
+    body = event.get("body")
+    if isinstance(body, str):
+        body = json.loads(body) if body else {{}}
+    fields = {{**(body or {{}}), **event}}
+    session_id = fields.get("session_id")
+    return (fields.get("prompt") or "").strip(), str(session_id) if session_id else None
+
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """Lambda 진입점"""
+    try:
+        prompt, session_id = _parse_event(event or {{}})
+    except (ValueError, TypeError, AttributeError):
+        return _response(400, {{"error": "요청 본문이 올바른 JSON이 아닙니다."}})
+
+    if not prompt:
+        return _response(400, {{"error": "prompt가 비어있습니다."}})
+
+    try:
+        agent = get_agent(session_id)
+        response = agent(prompt)
+        save_session(session_id, agent)
+    except Exception as e:
+        return _response(500, {{"error": str(e)}})
+
+    body = {{"response": str(response)}}
+    if session_id:
+        body["session_id"] = session_id
+    return _response(200, body)
+{streaming_app}
+
+# 프로비저닝된 동시성 / SnapStart 초기화 단계에서는 미리 클라이언트와 모델을 생성하여
+# 첫 요청이 초기화 비용을 지불하지 않도록 합니다.
+_init_type = os.environ.get("AWS_LAMBDA_INITIALIZATION_TYPE")
+if _init_type in ("provisioned-concurrency", "snap-start"):
+    get_agent_factory()
+
+
+def main():
+    """로컬 테스트용 실행 함수"""
+    result = handler({{"prompt": "안녕하세요! 어떻게 도와드릴까요?"}}, None)
+    print(f"응답: {{result['body']}}")
+    return result
+
+
+if __name__ == "__main__":
+    main()
+'''
+
+
+def size_lambda_function(analysis: Dict[str, Any]) -> Dict[str, int]:
+    """분석된 에이전트 타입과 AWS 서비스로 Lambda 메모리/타임아웃을 산정합니다."""
+
+    agent_type = analysis.get("agent_type", "basic")
+    memory = LAMBDA_BASE_MEMORY_MB.get(agent_type, LAMBDA_BASE_MEMORY_MB["basic"])
+    timeout = LAMBDA_BASE_TIMEOUT_S.get(agent_type, LAMBDA_BASE_TIMEOUT_S["basic"])
+
+    for service in analysis.get("aws_services", []):
+        memory += LAMBDA_SERVICE_MEMORY_MB.get(service, 64)
+        timeout += LAMBDA_SERVICE_TIMEOUT_S.get(service, 10)
+
+    # 코드 실행 도구는 인터프리터 상태를 메모리에 유지합니다
+    if "python_repl" in analysis.get("tools_needed", []):
+        memory += 256
+
+    # Lambda 메모리는 64MB 단위로 올림
+    memory = -(-memory // 64) * 64
+
+    return {
+        "memory": min(memory, LAMBDA_MAX_MEMORY_MB),
+        "timeout": min(timeout, LAMBDA_MAX_TIMEOUT_S)
+    }
+
+
+def generate_main_code(requirements: str, analysis: Dict[str, Any]) -> str:
+    """에이전트 타입에 맞는 생성기로 main.py 코드를 생성합니다."""
+
+    if analysis["agent_type"] == "multi_agent":
+        return generate_multi_agent(requirements, analysis)
+    if analysis["agent_type"] == "conversational":
+        return generate_conversational_agent(requirements, analysis)
+    return generate_basic_agent(requirements, analysis)
+
+
+def build_requirements_txt(analysis: Dict[str, Any]) -> str:
+    """requirements.txt 내용을 생성합니다."""
+
+    requirements_txt = f"""strands-agents>=1.7.0
+boto3>=1.40.0
+botocore>=1.40.0"""
+
+    if "python_repl" in analysis.get("tools_needed", []):
+        requirements_txt += "\nstrands-agents-tools>=1.0.0"
+    if is_streaming_lambda(analysis):
+        requirements_txt += "\nuvicorn>=0.30.0"
+
+    return requirements_txt
+
+
+def is_streaming_lambda(analysis: Dict[str, Any]) -> bool:
+    """Lambda Web Adapter로 응답을 스트리밍하는 프로젝트인지 (Lambda 대상 대화형 에이전트)"""
+
+    return analysis.get("deployment") == "lambda" and analysis.get("agent_type") == "conversational"
+
+
+def build_run_script(analysis: Dict[str, Any]) -> Optional[str]:
+    """응답 스트리밍 프로젝트의 Lambda 핸들러(run.sh) 내용을 생성합니다."""
+
+    if not is_streaming_lambda(analysis):
+        return None
+    return """#!/bin/bash
+# Lambda Web Adapter(/opt/bootstrap)가 이 스크립트로 ASGI 앱을 띄우고
+# 응답을 스트리밍으로 전달합니다.
+PATH=$PATH:$LAMBDA_TASK_ROOT/bin \\
+PYTHONPATH=$PYTHONPATH:/opt/python:$LAMBDA_RUNTIME_DIR \\
+exec python -m uvicorn --port=$PORT main:app
+"""
+
+
+def build_readme(requirements: str, analysis: Dict[str, Any]) -> str:
+    """생성된 프로젝트의 README.md 내용을 생성합니다."""
+
+    deployment_target = analysis["deployment"]
+
+    lambda_readme = ""
+    if deployment_target == "lambda":
+        lambda_readme = """
+Lambda에서는 `main.handler`가 진입점입니다. 이벤트의 `prompt` 필드
+(또는 API Gateway 요청 본문의 `prompt`)를 처리합니다. 클라이언트, 모델, 도구는
+컨테이너당 한 번만 초기화되고, 에이전트는 요청마다 새로 만들어 다른 요청의 대화가
+섞이지 않습니다. `session_id`를 함께 보내면 같은 컨테이너에 보관된 해당 세션의
+대화를 이어갑니다 (컨테이너 간에 공유되지 않으므로 영구 세션은 외부 저장소를 사용하세요).
+"""
+        if is_streaming_lambda(analysis):
+            lambda_readme += """
+대화형 에이전트는 진입점이 `run.sh`입니다. Lambda Web Adapter 레이어가 `run.sh`로
+`main:app`(ASGI)을 실행하며, 함수 URL(`RESPONSE_STREAM`)로 `{"prompt": ..., "session_id": ...}`를 POST하면 응답이
+토큰 단위로 스트리밍됩니다. `main.handler`는 버퍼링된 응답이 필요한 직접 호출과
+로컬 테스트용으로 남아 있습니다.
+
+```bash
+chmod +x run.sh
+```
+"""
+
+    references_readme = ""
+    if analysis.get("reference_examples"):
+        references = "\n".join(
+            f"- {example['title']}" for example in analysis["reference_examples"]
+        )
+        references_readme = f"""
+## 참고 예시
+요구사항과 가장 가까운 Strands 샘플이며, 에이전트의 시스템 프롬프트에도 포함되어 있습니다:
+{references}
+"""
+
+    return f"""# {requirements} - Strands Agent
+
+자동 생성된 Strands Agent 프로젝트입니다.
+
+## 기능
+- {requirements}
+- AWS 서비스 통합: {', '.join(analysis['aws_services'])}
+- 에이전트 타입: {analysis['agent_type']}
+
+## 설치
+```bash
+pip install -r requirements.txt
+```
+
+## 실행
+```bash
+python main.py
+```
+{lambda_readme}
+## AWS 설정
+다음 환경변수를 설정하거나 AWS CLI를 구성하세요:
+```bash
+export AWS_REGION=us-west-2
+export AWS_ACCESS_KEY_ID=your-key
+export AWS_SECRET_ACCESS_KEY=your-secret
+```
+{references_readme}
+## 배포
+- 대상: {deployment_target}
+- 생성 시간: {analysis.get("generated_at") or datetime.now().isoformat()}
+
+이 코드는 크롤링한 실제 Strands Agent 예시를 기반으로 생성되었습니다.
+"""
+
+
+def build_deployment_config(
+    analysis: Dict[str, Any],
+    provisioned_concurrency: int = 0,
+    snap_start: bool = False
+) -> Dict[str, Any]:
+    """배포 대상별 배포 설정을 생성합니다."""
+
+    if analysis["deployment"] != "lambda":
+        return {}
+
+    sizing = size_lambda_function(analysis)
+    deployment_config = {
+        "runtime": "python3.12" if snap_start else "python3.11",
+        "handler": "main.handler",
+        "timeout": sizing["timeout"],
+        "memory": sizing["memory"],
+        "environment": {
+            "AWS_REGION": "us-west-2"
+        }
+    }
+    if is_streaming_lambda(analysis):
+        deployment_config["handler"] = "run.sh"
+        deployment_config["layers"] = [LAMBDA_WEB_ADAPTER_LAYER]
+        deployment_config["environment"].update({
+            "AWS_LAMBDA_EXEC_WRAPPER": "/opt/bootstrap",
+            "AWS_LWA_INVOKE_MODE": "response_stream",
+            "PORT": str(LAMBDA_WEB_ADAPTER_PORT)
+        })
+        deployment_config["function_url"] = {
+            "auth_type": "AWS_IAM",
+            "invoke_mode": "RESPONSE_STREAM"
+        }
+    if provisioned_concurrency:
+        deployment_config["provisioned_concurrency"] = {
+            "alias": "live",
+            "count": provisioned_concurrency
+        }
+    if snap_start:
+        deployment_config["snap_start"] = {
+            "apply_on": "PublishedVersions"
+        }
+    return deployment_config
+
+
+@lru_cache(maxsize=PROJECT_CACHE_SIZE)
+def render_project_cached(inputs_json: str) -> Dict[str, Any]:
+    """정규화된 생성 입력(JSON)별로 프로젝트 렌더링 결과를 캐시합니다."""
+
+    inputs = json.loads(inputs_json)
+    requirements = inputs["requirements"]
+    analysis = inputs["analysis"]
+
+    project = {
+        "main_code": generate_main_code(requirements, analysis),
+        "requirements_txt": build_requirements_txt(analysis),
+        "readme_md": build_readme(requirements, analysis),
+        "deployment_config": build_deployment_config(
+            analysis,
+            inputs["provisioned_concurrency"],
+            inputs["snap_start"]
+        )
+    }
+    run_script = build_run_script(analysis)
+    if run_script:
+        project["run_sh"] = run_script
+    return project
+
+
+def render_project(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """생성 입력으로 프로젝트 파일들을 렌더링합니다 (같은 입력은 캐시 재사용)."""
+
+    cached = render_project_cached(json.dumps(inputs, sort_keys=True, ensure_ascii=False))
+    return dict(cached)
+
+
+def hash_section(value: Any) -> str:
+    """섹션 입력값의 짧은 해시"""
+
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def build_manifest(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    증분 재생성을 위한 매니페스트를 만듭니다.
+
+    생성 입력 전체와, 코드의 각 섹션(도구, 시스템 프롬프트, 모델 설정, 진입점,
+    requirements 등)을 결정하는 입력값의 해시를 담습니다. 섹션을 렌더링하지 않고
+    입력값만 해시하며, 각 섹션이 어떤 파일에 반영되는지는 MANIFEST_SECTION_FILES에 있습니다.
+    """
+
+    requirements = inputs["requirements"]
+    analysis = inputs["analysis"]
+    agent_type = analysis["agent_type"]
+    aws_services = analysis["aws_services"]
+    tools_needed = analysis.get("tools_needed", [])
+    prompt_caching = analysis.get("prompt_caching", False)
+
+    sections = {
+        # 멀티 에이전트의 도구는 고정된 전문 에이전트들입니다
+        "tools": agent_type if agent_type == "multi_agent" else [aws_services, tools_needed],
+        "system_prompt": [
+            requirements,
+            agent_type,
+            aws_services,
+            tools_needed,
+            prompt_caching,
+            analysis.get("reference_examples", [])
+        ],
+        "model_config": [agent_type, prompt_caching],
+        "entrypoint": [agent_type, analysis["deployment"]],
+        "requirements_txt": [agent_type, analysis["deployment"], tools_needed],
+        "readme": [
+            requirements,
+            aws_services,
+            agent_type,
+            analysis["deployment"],
+            analysis.get("reference_examples", [])
+        ],
+        "deployment_config": [
+            agent_type,
+            analysis["deployment"],
+            aws_services,
+            tools_needed,
+            inputs["provisioned_concurrency"],
+            inputs["snap_start"]
+        ]
+    }
+
+    return {
+        "version": "1.1.0",
+        "inputs": inputs,
+        "sections": {name: hash_section(value) for name, value in sections.items()}
+    }
+
+
+def render_project_file(path: str, inputs: Dict[str, Any]) -> Optional[str]:
+    """프로젝트 파일 하나만 렌더링합니다 (이 프로젝트에 없는 파일이면 None)."""
+
+    requirements = inputs["requirements"]
+    analysis = inputs["analysis"]
+
+    if path == "main.py":
+        return generate_main_code(requirements, analysis)
+    if path == "requirements.txt":
+        return build_requirements_txt(analysis) + "\n"
+    if path == "README.md":
+        return build_readme(requirements, analysis)
+    if path == "deployment_config.json":
+        return json.dumps(
+            build_deployment_config(
+                analysis,
+                inputs["provisioned_concurrency"],
+                inputs["snap_start"]
+            ),
+            indent=2,
+            ensure_ascii=False
+        ) + "\n"
+    if path == "run.sh":
+        return build_run_script(analysis)
+    raise ValueError(f"알 수 없는 프로젝트 파일: {path}")
+
+
+def diff_project_files(
+    previous_inputs: Dict[str, Any],
+    inputs: Dict[str, Any],
+    paths: List[str]
+) -> Dict[str, Any]:
+    """
+    주어진 파일만 이전/현재 입력으로 렌더링하여 통합 diff(unified diff)를 만듭니다.
+
+    바뀐 섹션이 반영되는 파일만 넘기므로 나머지 파일은 렌더링하지 않습니다.
+    """
+
+    patches = []
+    changed_files = []
+    rendered = {}
+    for path in paths:
+        before = render_project_file(path, previous_inputs)
+        after = render_project_file(path, inputs)
+        rendered[path] = after
+        if before == after:
+            continue
+        changed_files.append(path)
+        patches.extend(difflib.unified_diff(
+            (before or "").splitlines(keepends=True),
+            (after or "").splitlines(keepends=True),
+            fromfile=f"a/{path}" if before is not None else "/dev/null",
+            tofile=f"b/{path}" if after is not None else "/dev/null"
+        ))
+
+    return {"patch": "".join(patches), "changed_files": changed_files, "rendered": rendered}
+
+
+# strands-mcp/tool_executor.py에 같은 구조의 offload/ToolMetrics가 있습니다. 두 서버는
+# 공유 패키지가 없는 별도 프로젝트이므로 수정할 때는 양쪽에 함께 반영합니다.
+class ToolMetrics:
+    """도구별 실행 지표 (이벤트 루프 스레드에서만 갱신)"""
+
+    def __init__(self, max_concurrency: int, max_queue: int) -> None:
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.running = 0
+        self.queued = 0
+        self.calls = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.cancelled = 0
+        self.queue_waits_ms: "deque[float]" = deque(maxlen=TOOL_METRICS_WINDOW)
+        self.run_times_ms: "deque[float]" = deque(maxlen=TOOL_METRICS_WINDOW)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태와 최근 대기/실행 시간 분포를 반환합니다."""
+
+        def summarize(samples: "deque[float]") -> Dict[str, float]:
+            if not samples:
+                return {"count": 0, "avg": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+            values = np.fromiter(samples, dtype=np.float64)
+            return {
+                "count": int(values.size),
+                "avg": round(float(values.mean()), 3),
+                "p50": round(float(np.percentile(values, 50)), 3),
+                "p99": round(float(np.percentile(values, 99)), 3),
+                "max": round(float(values.max()), 3)
+            }
+
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "running": self.running,
+            "queued": self.queued,
+            "calls": self.calls,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "cancelled": self.cancelled,
+            "queue_wait_ms": summarize(self.queue_waits_ms),
+            "run_time_ms": summarize(self.run_times_ms)
+        }
+
+
+def get_tool_executor() -> ThreadPoolExecutor:
+    """동기 도구를 실행할 공용 스레드 풀을 반환합니다 (최초 호출 시 생성)."""
+
+    global _tool_executor
+    if _tool_executor is None:
+        _tool_executor = ThreadPoolExecutor(
+            max_workers=TOOL_EXECUTOR_WORKERS, thread_name_prefix="strands-tool"
+        )
+    return _tool_executor
+
+
+def busy_response(name: str, metrics: ToolMetrics, returns_text: bool) -> Any:
+    """포화 상태에서 즉시 돌려줄 응답 (문자열 도구는 문자열, 그 외는 오류 형식)"""
+
+    message = (
+        f"서버가 바쁩니다: {name} 실행 {metrics.running}건, "
+        f"대기 {metrics.queued}건 (한도 {metrics.max_concurrency}+{metrics.max_queue})"
+    )
+    if returns_text:
+        return f"⏳ {message}. 잠시 후 다시 시도하세요."
+    return {
+        "success": False,
+        "error": message,
+        "error_type": "ServerBusy",
+        "suggestions": ["잠시 후 다시 시도하세요."]
+    }
+
+
+def offload(
+    max_concurrency: int = TOOL_MAX_CONCURRENCY,
+    max_queue: int = TOOL_MAX_QUEUE
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    동기 도구를 이벤트 루프 밖의 공용 스레드 풀에서 실행하도록 감쌉니다.
+
+    도구별로 동시에 `max_concurrency`건까지 실행하고 `max_queue`건까지 대기시키며,
+    그 이상 들어온 호출은 기다리지 않고 바로 busy 응답을 반환합니다.
+    대기 시간(세마포어 + 스레드 풀 대기)은 실행 시간과 따로 기록됩니다.
+    `@mcp.tool()` 아래에 두어 감싼 비동기 함수가 등록되도록 합니다.
+
+    취소된 호출은 `cancelled`로 집계하며, 이미 스레드에서 실행 중이면 스레드를 멈출 수
+    없으므로 실행이 끝날 때까지 슬롯을 반납하지 않습니다.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        metrics = _tool_metrics[fn.__name__] = ToolMetrics(max_concurrency, max_queue)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        returns_text = inspect.signature(fn).return_annotation is str
+
+        def run(timing: Dict[str, float], args: Any, kwargs: Any) -> Any:
+            timing["started"] = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                timing["finished"] = time.perf_counter()
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            metrics.calls += 1
+            if metrics.running + metrics.queued >= max_concurrency + max_queue:
+                metrics.rejected += 1
+                return busy_response(fn.__name__, metrics, returns_text)
+
+            timing: Dict[str, float] = {"enqueued": time.perf_counter()}
+            metrics.queued += 1
+            try:
+                await semaphore.acquire()
+            except asyncio.CancelledError:
+                metrics.cancelled += 1
+                raise
+            finally:
+                metrics.queued -= 1
+
+            def finish(future: "asyncio.Future[Any]") -> None:
+                # 호출자가 취소되어도 스레드 실행이 끝난 뒤 이벤트 루프에서 슬롯을 반납합니다
+                metrics.running -= 1
+                semaphore.release()
+                if future.cancelled() or future.exception() is not None:
+                    metrics.failed += 1
+                else:
+                    metrics.completed += 1
+                if "finished" in timing:
+                    metrics.queue_waits_ms.append((timing["started"] - timing["enqueued"]) * 1000)
+                    metrics.run_times_ms.append((timing["finished"] - timing["started"]) * 1000)
+
+            metrics.running += 1
+            future = asyncio.get_running_loop().run_in_executor(
+                get_tool_executor(), run, timing, args, kwargs
+            )
+            future.add_done_callback(finish)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                metrics.cancelled += 1
+                raise
+
+        return wrapper
+
+    return decorator
+
+
+@mcp.tool()
+@offload()
+def generate_strands_agent(
+    requirements: str,
+    agent_type: Optional[str] = None,
+    aws_services: Optional[List[str]] = None,
+    deployment_target: str = "lambda",
+    provisioned_concurrency: int = 0,
+    snap_start: bool = False,
+    prompt_caching: bool = False,
+    previous_manifest: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    요구사항을 바탕으로 Strands Agent 코드를 자동 생성합니다.
+    
+    크롤링한 실제 예시를 기반으로 완전한 프로젝트를 생성합니다.
+    
+    Args:
+        requirements: 에이전트 요구사항 (자연어로 상세히)
+        agent_type: 에이전트 타입 (basic, multi_agent, conversational)
+        aws_services: 사용할 AWS 서비스 목록
+        deployment_target: 배포 대상 (lambda, ecs, local)
+        provisioned_concurrency: Lambda 프로비저닝된 동시성 수 (0이면 미사용)
+        snap_start: Lambda SnapStart 사용 여부 (python3.12 런타임 사용)
+        prompt_caching: 시스템 프롬프트/도구 정의 프롬프트 캐싱 및 축약 프롬프트 사용
+        previous_manifest: 이전 응답의 metadata.manifest (지정하면 증분 모드로
+            이전 프로젝트 대비 unified diff만 반환)
+        
+    Returns:
+        생성된 완전한 프로젝트 구조 (증분 모드에서는 patch와 변경된 섹션 목록)
+    """
+    
+    # 입력 검증
+    if not requirements or not requirements.strip():
+        return {
+            "success": False,
+            "error": "요구사항이 비어있습니다.",
+            "suggestions": [
+                "구체적인 에이전트 기능을 설명해주세요.",
+                "예: '고객 문의를 처리하고 S3에 저장하는 에이전트'"
+            ]
+        }
+
+    if provisioned_concurrency < 0:
+        return {
+            "success": False,
+            "error": "provisioned_concurrency는 0 이상이어야 합니다.",
+            "suggestions": ["프로비저닝된 동시성을 사용하지 않으려면 0을 지정하세요."]
+        }
+
+    if provisioned_concurrency and snap_start:
+        return {
+            "success": False,
+            "error": "SnapStart와 프로비저닝된 동시성은 같은 함수 버전에 함께 사용할 수 없습니다.",
+            "suggestions": [
+                "지연 시간이 가장 중요하면 provisioned_concurrency만 지정하세요.",
+                "비용을 줄이면서 콜드 스타트를 줄이려면 snap_start만 사용하세요."
+            ]
+        }
+    
+    if previous_manifest is not None and not (
+        isinstance(previous_manifest.get("inputs"), dict)
+        and isinstance(previous_manifest.get("sections"), dict)
+    ):
+        return {
+            "success": False,
+            "error": "previous_manifest 형식이 올바르지 않습니다.",
+            "suggestions": [
+                "이전 generate_strands_agent 응답의 metadata.manifest를 그대로 전달하세요.",
+                "매니페스트가 없으면 previous_manifest 없이 전체 프로젝트를 생성하세요."
+            ]
+        }
+
+    try:
+        # 요구사항 분석
+        analysis = analyze_requirements(requirements)
+        analysis["deployment"] = deployment_target
+        analysis["prompt_caching"] = prompt_caching
+        analysis["generated_at"] = datetime.now().isoformat()
+        
+        # 사용자 지정값 우선 적용
+        if agent_type:
+            analysis["agent_type"] = agent_type
+        if aws_services:
+            analysis["aws_services"] = aws_services
+
+        # 요구사항과 가장 가까운 실제 샘플을 시스템 프롬프트와 README의 참고 예시로 사용
+        reference_examples = select_examples(requirements)
+        analysis["reference_examples"] = [
+            {"title": example["title"], "summary": summarize_example(example["excerpt"])}
+            for example in reference_examples
+        ]
+
+        # 증분 모드에서는 이전 생성 시간을 유지하여 타임스탬프만 바뀐 diff를 막습니다
+        if previous_manifest:
+            analysis["generated_at"] = previous_manifest["inputs"]["analysis"]["generated_at"]
+        
+        inputs = {
+            "requirements": requirements,
+            "analysis": analysis,
+            "provisioned_concurrency": provisioned_concurrency,
+            "snap_start": snap_start
+        }
+        manifest = build_manifest(inputs)
+
+        # 증분 모드: 입력이 바뀐 섹션이 있을 때만 다시 렌더링하고 diff만 반환
+        if previous_manifest:
+            changed_sections = [
+                name for name, digest in manifest["sections"].items()
+                if previous_manifest["sections"].get(name) != digest
+            ]
+            metadata = {
+                "timestamp": datetime.now().isoformat(),
+                "version": "1.0.0",
+                "mode": "incremental",
+                "analysis": analysis,
+                "manifest": manifest
+            }
+
+            if not changed_sections:
+                return {
+                    "success": True,
+                    "data": {"patch": "", "changed_sections": [], "changed_files": []},
+                    "metadata": metadata
+                }
+
+            # 바뀐 섹션이 반영되는 파일만 이전/현재 입력으로 렌더링하여 비교
+            touched_files = sorted({
+                path for name in changed_sections for path in MANIFEST_SECTION_FILES[name]
+            })
+            diff = diff_project_files(previous_manifest["inputs"], inputs, touched_files)
+            main_code = diff.pop("rendered").get("main.py")
+            if main_code:
+                metadata["prompt_tokens"] = estimate_prompt_tokens(main_code, prompt_caching)
+            return {
+                "success": True,
+                "data": {"changed_sections": changed_sections, **diff},
+                "metadata": metadata
+            }
+
+        project = render_project(inputs)
+
+        return {
+            "success": True,
+            "data": project,
+            "metadata": {
+                "timestamp": datetime.now().isoformat(),
+                "version": "1.0.0",
+                "analysis": analysis,
+                "prompt_tokens": estimate_prompt_tokens(project["main_code"], prompt_caching),
+                "manifest": manifest,
+                "reference_examples": reference_examples,
+                "based_on": "크롤링한 실제 Strands Agent 예시"
+            }
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"코드 생성 중 오류: {str(e)}",
+            "error_type": type(e).__name__
+        }
+
+
+def is_tool_function(node: ast.AST) -> bool:
+    """`@tool` 또는 `@tool(...)`로 장식된 함수인지 확인합니다."""
+
+    return isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and any(
+        (isinstance(decorator, ast.Name) and decorator.id == "tool")
+        or (
+            isinstance(decorator, ast.Call)
+            and getattr(decorator.func, "id", None) == "tool"
+        )
+        for decorator in node.decorator_list
     )
-    return agent(task)
 
-# 마스터 에이전트 (오케스트레이터)
-master_agent = Agent(
-    model=BedrockModel(model_id="anthropic.claude-3-5-sonnet-20241022-v2:0"),
-    tools=[coordinator_agent, processor_agent, validator_agent],
-    system_prompt=f"""
-당신은 {requirements}를 위한 마스터 코디네이터입니다.
-
-여러 전문 에이전트를 조율하여 복잡한 작업을 효율적으로 처리하세요:
-- coordinator_agent: 작업 분석 및 할당
-- processor_agent: 데이터 처리 및 분석  
-- validator_agent: 결과 검증 및 품질 보장
-
-각 에이전트의 전문성을 활용하여 최고의 결과를 제공하세요.
-"""
-)
 
-def main():
-    """메인 실행 함수"""
+def analyze_agent_source(source: str) -> Dict[str, Any]:
+    """
+    단일 Python 파일을 정적 분석합니다.
+
+    줄 단위 규칙(길이, 탭)과 AST 규칙(Strands import, `@tool` 시그니처와
+    타입 힌트, 함수 명명)을 검사하고, 프로젝트 단위의 도구 등록 검사를 위해
+    정의/등록된 도구 이름을 함께 반환합니다.
+    """
+
+    issues: List[Dict[str, Any]] = []
+
+    def add_issue(line: int, severity: str, rule: str, message: str) -> None:
+        issues.append({"line": line, "severity": severity, "rule": rule, "message": message})
+
+    for number, line in enumerate(source.splitlines(), 1):
+        if "\t" in line:
+            add_issue(number, "error", "tab", "탭 문자 대신 4칸 스페이스를 사용하세요.")
+        if len(line) > MAX_LINE_LENGTH:
+            add_issue(
+                number, "warning", "line-length",
+                f"라인 길이 {len(line)}자가 {MAX_LINE_LENGTH}자를 초과합니다."
+            )
+
+    result = {"issues": issues, "defined_tools": [], "imported_tools": [], "registered_tools": []}
+
     try:
-        print("🤖 멀티 에이전트 시스템이 시작되었습니다!")
-        print(f"목적: {requirements}")
-        
-        # 테스트 실행
-        response = master_agent("복잡한 작업을 처리해주세요")
-        print(f"응답: {response}")
-        
-        return response
-    except Exception as e:
-        print(f"오류 발생: {e}")
-        return None
+        tree = ast.parse(source)
+    except SyntaxError as e:
+        add_issue(e.lineno or 0, "error", "syntax", f"문법 오류: {e.msg}")
+        return result
 
-if __name__ == "__main__":
-    main()
-'''
-    
-    return code
+    imported = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            for alias in node.names:
+                name = alias.asname or alias.name
+                if node.module.split(".")[0] == "strands":
+                    imported.add(alias.name)
+                if node.module == "strands_tools":
+                    result["imported_tools"].append(name)
+
+    tool_functions = []
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+
+        if any(char.isupper() for char in node.name.lstrip("_")):
+            add_issue(
+                node.lineno, "error", "naming",
+                f"함수 '{node.name}'는 snake_case로 명명해야 합니다."
+            )
+
+        is_tool = is_tool_function(node)
+        arguments = node.args.posonlyargs + node.args.args + node.args.kwonlyargs
+        arguments = [arg for arg in arguments if arg.arg not in ("self", "cls")]
+        unannotated = [arg.arg for arg in arguments if arg.annotation is None]
+        severity = "error" if is_tool else "warning"
+
+        if unannotated:
+            add_issue(
+                node.lineno, severity, "type-hints",
+                f"함수 '{node.name}'의 인자 {', '.join(unannotated)}에 타입 힌트가 없습니다."
+            )
+        if node.returns is None:
+            add_issue(
+                node.lineno, severity, "type-hints",
+                f"함수 '{node.name}'에 반환 타입 힌트가 없습니다."
+            )
+
+        if not is_tool:
+            continue
+
+        tool_functions.append(node)
+        result["defined_tools"].append(node.name)
+
+        if not ast.get_docstring(node):
+            add_issue(
+                node.lineno, "error", "tool-docstring",
+                f"도구 '{node.name}'에 docstring이 없습니다 (도구 설명으로 사용됩니다)."
+            )
+
+        defaults = node.args.defaults
+        for arg, default in zip(node.args.args[-len(defaults):] if defaults else [], defaults):
+            if (
+                isinstance(default, ast.Constant) and default.value is None
+                and arg.annotation is not None
+                and "Optional" not in ast.unparse(arg.annotation)
+                and "None" not in ast.unparse(arg.annotation)
+            ):
+                add_issue(
+                    node.lineno, "warning", "implicit-optional",
+                    f"도구 '{node.name}'의 인자 '{arg.arg}'는 기본값이 None이므로 "
+                    f"Optional[{ast.unparse(arg.annotation)}]로 선언하세요."
+                )
+
+    # `TOOLS = [...]`처럼 이름에 담아 Agent(tools=TOOLS)로 넘기는 도구 목록
+    tool_lists = {
+        target.id: node.value
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Assign) and isinstance(node.value, (ast.List, ast.Tuple))
+        for target in node.targets
+        if isinstance(target, ast.Name)
+    }
+
+    agent_calls = [
+        node for node in ast.walk(tree)
+        if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "Agent"
+    ]
+    for node in agent_calls:
+        for keyword in node.keywords:
+            if keyword.arg != "tools":
+                continue
+            value = keyword.value
+            if isinstance(value, ast.Name):
+                value = tool_lists.get(value.id, value)
+            if isinstance(value, (ast.List, ast.Tuple)):
+                result["registered_tools"].extend(
+                    element.id for element in value.elts
+                    if isinstance(element, ast.Name)
+                )
+
+    # 도구 모듈(tools.py)은 tool만, Agent를 만드는 모듈만 Agent import가 필요합니다
+    if agent_calls and "Agent" not in imported:
+        add_issue(
+            agent_calls[0].lineno, "error", "strands-import",
+            "'from strands import Agent'가 없습니다."
+        )
+    if tool_functions and "tool" not in imported:
+        add_issue(
+            tool_functions[0].lineno, "error", "strands-import",
+            "'from strands import tool' 또는 'from strands.tools import tool'이 없습니다."
+        )
+
+    return result
+
+
+def analyze_agent_sources(sources: List[str]) -> List[Dict[str, Any]]:
+    """
+    파일 해시 기준으로 캐시된 분석 결과를 재사용하고 나머지를 분석합니다.
+
+    캐시에 없는 파일이 여럿이면 공용 도구 스레드 풀에서 나누어 분석합니다
+    (프로세스 풀은 파일당 수 ms인 분석보다 생성/직렬화 비용이 더 큽니다).
+    잠금은 캐시 조회/갱신에만 사용하고 분석은 잠금 밖에서 합니다.
+    """
+
+    digests = [
+        hashlib.sha256(source.encode("utf-8")).hexdigest() for source in sources
+    ]
+    with _validation_cache_lock:
+        cached = {
+            digest: _validation_cache[digest]
+            for digest in digests if digest in _validation_cache
+        }
+    pending = {
+        digest: source for digest, source in zip(digests, sources)
+        if digest not in cached
+    }
+
+    if len(pending) > 1:
+        analyses = get_tool_executor().map(analyze_agent_source, pending.values())
+    else:
+        analyses = map(analyze_agent_source, pending.values())
+    fresh = dict(zip(pending, analyses))
+    with _validation_cache_lock:
+        for digest in digests:
+            _validation_cache[digest] = fresh.get(digest) or cached[digest]
+            _validation_cache.move_to_end(digest)
+        while len(_validation_cache) > VALIDATION_CACHE_SIZE:
+            _validation_cache.popitem(last=False)
+
+    return [
+        {
+            **(fresh.get(digest) or cached[digest]),
+            "sha256": digest,
+            "cached": digest not in fresh
+        }
+        for digest in digests
+    ]
 
 
 @mcp.tool()
-def generate_strands_agent(
-    requirements: str,
-    agent_type: Optional[str] = None,
-    aws_services: Optional[List[str]] = None,
-    deployment_target: str = "lambda"
+@offload(max_concurrency=2, max_queue=8)
+def validate_agent_code(
+    code: Optional[str] = None,
+    files: Optional[Dict[str, str]] = None
 ) -> Dict[str, Any]:
     """
-    요구사항을 바탕으로 Strands Agent 코드를 자동 생성합니다.
-    
-    크롤링한 실제 예시를 기반으로 완전한 프로젝트를 생성합니다.
-    
+    생성된 Strands Agent 코드를 정적으로 검증하고 개선 방법을 제안합니다.
+
+    `ast`로 파싱하여 Strands import, `@tool` 함수의 타입 힌트와 docstring,
+    `Agent(tools=[...])` 등록 여부, 라인 길이(88자)/탭/명명 규칙을 검사합니다.
+    결과는 파일 해시 기준으로 캐시됩니다.
+
     Args:
-        requirements: 에이전트 요구사항 (자연어로 상세히)
-        agent_type: 에이전트 타입 (basic, multi_agent, conversational)
-        aws_services: 사용할 AWS 서비스 목록
-        deployment_target: 배포 대상 (lambda, ecs, local)
-        
+        code: 검증할 단일 파일 코드 (main.py로 취급)
+        files: 파일 경로와 코드의 매핑 (.py 파일만 검증)
+
     Returns:
-        생성된 완전한 프로젝트 구조
+        파일별 검증 결과와 개선 제안
     """
-    
-    # 입력 검증
-    if not requirements or not requirements.strip():
+
+    project = dict(files or {})
+    if code:
+        project["main.py"] = code
+    project = {path: source for path, source in project.items() if path.endswith(".py")}
+
+    if not project:
         return {
             "success": False,
-            "error": "요구사항이 비어있습니다.",
+            "error": "검증할 Python 코드가 없습니다.",
             "suggestions": [
-                "구체적인 에이전트 기능을 설명해주세요.",
-                "예: '고객 문의를 처리하고 S3에 저장하는 에이전트'"
+                "code에 main.py 내용을 전달하거나",
+                "files에 {'main.py': '...'} 형태로 프로젝트 파일을 전달하세요."
             ]
         }
-    
+
     try:
-        # 요구사항 분석
-        analysis = analyze_requirements(requirements)
-        
-        # 사용자 지정값 우선 적용
-        if agent_type:
-            analysis["agent_type"] = agent_type
-        if aws_services:
-            analysis["aws_services"] = aws_services
-        
-        # 코드 생성
-        if analysis["agent_type"] == "multi_agent":
-            main_code = generate_multi_agent(requirements, analysis)
-        else:
-            main_code = generate_basic_agent(requirements, analysis)
-        
-        # requirements.txt 생성
-        requirements_txt = f"""strands-agents>=1.7.0
-boto3>=1.40.0
-botocore>=1.40.0"""
-        
-        if "python_repl" in analysis.get("tools_needed", []):
-            requirements_txt += "\nstrands-agents-tools>=1.0.0"
-        
-        # README.md 생성
-        readme = f"""# {requirements} - Strands Agent
+        paths = sorted(project)
+        analyses = analyze_agent_sources([project[path] for path in paths])
 
-자동 생성된 Strands Agent 프로젝트입니다.
+        defined = set()
+        registered = set()
+        for analysis in analyses:
+            defined.update(analysis["defined_tools"], analysis["imported_tools"])
+            registered.update(analysis["registered_tools"])
 
-## 기능
-- {requirements}
-- AWS 서비스 통합: {', '.join(analysis['aws_services'])}
-- 에이전트 타입: {analysis['agent_type']}
+        project_issues = [
+            {
+                "severity": "warning",
+                "rule": "tool-registration",
+                "message": f"도구 '{name}'가 정의되었지만 Agent(tools=[...])에 등록되지 않았습니다."
+            }
+            for name in sorted(set().union(*(a["defined_tools"] for a in analyses)) - registered)
+        ] + [
+            {
+                "severity": "error",
+                "rule": "tool-registration",
+                "message": f"Agent(tools=[...])에 등록된 '{name}'가 정의되지 않았습니다."
+            }
+            for name in sorted(registered - defined)
+        ]
 
-## 설치
-```bash
-pip install -r requirements.txt
-```
+        all_issues = project_issues + [
+            issue for analysis in analyses for issue in analysis["issues"]
+        ]
+        errors = sum(1 for issue in all_issues if issue["severity"] == "error")
+        rules = sorted({issue["rule"] for issue in all_issues})
 
-## 실행
-```bash
-python main.py
-```
+        return {
+            "success": True,
+            "data": {
+                "valid": errors == 0,
+                "files": {
+                    path: {
+                        "issues": analysis["issues"],
+                        "tools": analysis["defined_tools"],
+                        "sha256": analysis["sha256"],
+                        "cached": analysis["cached"]
+                    }
+                    for path, analysis in zip(paths, analyses)
+                },
+                "project_issues": project_issues,
+                "summary": {
+                    "files": len(paths),
+                    "errors": errors,
+                    "warnings": len(all_issues) - errors
+                },
+                "suggestions": [
+                    VALIDATION_SUGGESTIONS[rule] for rule in rules
+                    if rule in VALIDATION_SUGGESTIONS
+                ]
+            },
+            "metadata": {
+                "timestamp": datetime.now().isoformat(),
+                "version": "1.0.0",
+                "cache_hits": sum(1 for analysis in analyses if analysis["cached"])
+            }
+        }
 
-## AWS 설정
-다음 환경변수를 설정하거나 AWS CLI를 구성하세요:
-```bash
-export AWS_REGION=us-west-2
-export AWS_ACCESS_KEY_ID=your-key
-export AWS_SECRET_ACCESS_KEY=your-secret
-```
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"코드 검증 중 오류: {str(e)}",
+            "error_type": type(e).__name__
+        }
 
-## 배포
-- 대상: {deployment_target}
-- 생성 시간: {datetime.now().isoformat()}
 
-이 코드는 크롤링한 실제 Strands Agent 예시를 기반으로 생성되었습니다.
-"""
-        
-        # 배포 설정 생성
-        deployment_config = {}
-        if deployment_target == "lambda":
-            deployment_config = {
-                "runtime": "python3.11",
-                "handler": "main.main",
-                "timeout": 300,
-                "memory": 512,
-                "environment": {
-                    "AWS_REGION": "us-west-2"
-                }
+def find_cold_start_issues(source: str) -> List[Dict[str, Any]]:
+    """
+    콜드 스타트를 늘리는 생성 코드 패턴을 찾습니다.
+
+    import 시 실행되는 모듈 최상위 코드(함수/클래스 본문과 `__main__` 블록 제외)의
+    boto3 클라이언트, Agent/BedrockModel 생성과 `@tool` 안의 매 호출 생성을 검사합니다.
+    """
+
+    issues: List[Dict[str, Any]] = []
+
+    def call_kind(node: ast.AST) -> Optional[str]:
+        if not isinstance(node, ast.Call):
+            return None
+        func = node.func
+        if (
+            isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name)
+            and func.value.id == "boto3"
+            and func.attr in ("client", "resource", "Session")
+        ):
+            return "client"
+        if isinstance(func, ast.Name) and func.id in ("Agent", "BedrockModel"):
+            return "agent"
+        return None
+
+    def add_issue(node: ast.AST, rule: str, message: str) -> None:
+        issues.append({
+            "line": node.lineno,
+            "severity": "warning",
+            "rule": rule,
+            "message": message,
+            "suggestion": COLD_START_SUGGESTIONS[rule]
+        })
+
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return issues
+
+    for statement in tree.body:
+        if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        if isinstance(statement, ast.If) and "__main__" in ast.unparse(statement.test):
+            continue
+        for node in ast.walk(statement):
+            kind = call_kind(node)
+            if kind == "client":
+                add_issue(
+                    node, "eager-aws-client",
+                    f"모듈 import 시 {ast.unparse(node.func)}()가 실행됩니다."
+                )
+            elif kind == "agent":
+                add_issue(
+                    node, "eager-agent",
+                    f"모듈 import 시 {ast.unparse(node.func)}가 생성됩니다."
+                )
+
+    for function in ast.walk(tree):
+        if not is_tool_function(function):
+            continue
+        for node in ast.walk(function):
+            kind = call_kind(node)
+            if kind == "agent":
+                add_issue(
+                    node, "agent-in-tool",
+                    f"도구 '{function.name}'가 호출될 때마다 {ast.unparse(node.func)}를 생성합니다."
+                )
+            elif kind == "client":
+                add_issue(
+                    node, "client-in-tool",
+                    f"도구 '{function.name}'가 호출될 때마다 {ast.unparse(node.func)}()를 실행합니다."
+                )
+
+    return sorted(issues, key=lambda issue: issue["line"])
+
+
+def parse_import_entries(lines: List[str]) -> List[Tuple[int, int, int, str]]:
+    """`-X importtime` 줄을 (self μs, 누적 μs, 깊이, 모듈 이름) 목록으로 바꿉니다."""
+
+    entries = []
+    for line in lines:
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            depth = (len(indent) - 1) // 2
+            entries.append((int(self_us), int(cumulative_us), depth, name))
+    return entries
+
+
+def sum_by_package(
+    entries: List[Tuple[int, int, int, str]], depth: int
+) -> List[Dict[str, Any]]:
+    """`depth` 깊이 항목의 누적 시간을 최상위 패키지별로 합산해 큰 순서로 반환합니다."""
+
+    packages: Dict[str, int] = {}
+    for _, cumulative_us, entry_depth, name in entries:
+        if entry_depth == depth:
+            root = name.split(".")[0]
+            packages[root] = packages.get(root, 0) + cumulative_us
+
+    ranked = sorted(packages.items(), key=lambda item: -item[1])
+    return [
+        {"package": name, "cumulative_ms": round(us / 1000, 2)}
+        for name, us in ranked[:PROFILE_TOP_IMPORTS]
+    ]
+
+
+def parse_import_times(stderr: str, module: str = "main") -> Dict[str, Any]:
+    """
+    `-X importtime` 출력에서 `module`의 import 비용을 분해합니다.
+
+    모듈 자신의 self 시간이 모듈 최상위 코드 실행(초기화) 시간이고, 직접 import한
+    모듈들은 최상위 패키지별 누적 시간으로 합산합니다. 지연 초기화 구간은
+    parse_lazy_init_imports가 따로 분해합니다.
+    """
+
+    lines = stderr.splitlines()
+    if LAZY_INIT_START in lines:
+        lines = lines[:lines.index(LAZY_INIT_START)]
+    entries = parse_import_entries(lines)
+
+    index = next(
+        (
+            i for i in range(len(entries) - 1, -1, -1)
+            if entries[i][3] == module and entries[i][2] == 0
+        ),
+        None
+    )
+    if index is None:
+        return {}
+
+    start = index
+    while start > 0 and entries[start - 1][2] > 0:
+        start -= 1
+
+    self_us, cumulative_us = entries[index][:2]
+    return {
+        "total_ms": round(cumulative_us / 1000, 2),
+        "module_init_ms": round(self_us / 1000, 2),
+        "imports_ms": round((cumulative_us - self_us) / 1000, 2),
+        "by_package": sum_by_package(entries[start:index], depth=1)
+    }
+
+
+def parse_lazy_init_imports(stderr: str) -> Optional[Dict[str, Any]]:
+    """
+    `get_agent()` 지연 초기화 구간(stderr 표시 줄 사이)의 import 비용을 분해합니다.
+
+    생성 코드는 Strands/boto3를 get_agent()에서 import하므로 이 구간의 최상위
+    (깊이 0) 항목이 패키지별 지연 import 비용입니다. 구간이 없으면 None입니다.
+    """
+
+    lines = stderr.splitlines()
+    if LAZY_INIT_START not in lines:
+        return None
+    lines = lines[lines.index(LAZY_INIT_START) + 1:]
+    if LAZY_INIT_END in lines:
+        lines = lines[:lines.index(LAZY_INIT_END)]
+
+    entries = parse_import_entries(lines)
+    imports_us = sum(entry[1] for entry in entries if entry[2] == 0)
+    return {
+        "imports_ms": round(imports_us / 1000, 2),
+        "by_package": sum_by_package(entries, depth=0)
+    }
+
+
+def profile_environment(initialization_type: str) -> Dict[str, str]:
+    """
+    하위 프로세스 환경 변수를 만듭니다.
+
+    측정 대상 코드가 실제 AWS를 호출하지 않도록 리전 외의 AWS_* 변수(자격 증명,
+    프로필, 컨테이너 자격 증명 URI 등)를 빼고 자격 증명/설정 파일도 비웁니다.
+    """
+
+    env = {
+        key: value for key, value in os.environ.items()
+        if not key.startswith("AWS_") or key in PROFILE_ENV_KEEP_AWS
+    }
+    env.pop("PYTHONPATH", None)
+    env.setdefault("AWS_DEFAULT_REGION", env.get("AWS_REGION", "us-east-1"))
+    env["AWS_LAMBDA_INITIALIZATION_TYPE"] = initialization_type
+    env["AWS_EC2_METADATA_DISABLED"] = "true"
+    env["AWS_SHARED_CREDENTIALS_FILE"] = os.devnull
+    env["AWS_CONFIG_FILE"] = os.devnull
+    return env
+
+
+@mcp.tool()
+@offload(max_concurrency=2, max_queue=8)
+def profile_generated_agent(
+    main_code: Optional[str] = None,
+    requirements: Optional[str] = None,
+    agent_type: Optional[str] = None,
+    aws_services: Optional[List[str]] = None,
+    deployment_target: str = "lambda",
+    provisioned_concurrency: int = 0,
+    snap_start: bool = False,
+    use_stubs: bool = True,
+    initialization_type: str = "on-demand"
+) -> Dict[str, Any]:
+    """
+    생성된 에이전트 main.py의 콜드 스타트 비용을 측정합니다.
+
+    프로젝트를 임시 디렉터리에 쓰고 별도 프로세스에서 `python -X importtime`으로
+    import하여 패키지별 import 시간, 모듈 최상위 초기화 시간, `get_agent()` 지연
+    초기화 시간, 최대 RSS를 보고하고 콜드 스타트를 늘리는 코드 패턴을 표시합니다.
+
+    Args:
+        main_code: 측정할 main.py (generate_strands_agent 결과의 data.main_code)
+        requirements: main_code 대신 지정하면 이 요구사항으로 프로젝트를 생성하여 측정
+        agent_type: 생성 시 에이전트 타입 (basic, multi_agent, conversational)
+        aws_services: 생성 시 사용할 AWS 서비스 목록
+        deployment_target: 생성 시 배포 대상 (lambda, ecs, local)
+        provisioned_concurrency: 생성 시 Lambda 프로비저닝된 동시성 수
+        snap_start: 생성 시 Lambda SnapStart 사용 여부
+        use_stubs: True면 Strands/boto3 대역 패키지로, False면 설치된 실제 패키지로 측정
+        initialization_type: AWS_LAMBDA_INITIALIZATION_TYPE 값
+            (on-demand, provisioned-concurrency, snap-start)
+
+    Returns:
+        import 시간 분해, 초기화 시간, RSS와 콜드 스타트 경고
+    """
+
+    if not main_code:
+        if not requirements:
+            return {
+                "success": False,
+                "error": "측정할 코드가 없습니다.",
+                "suggestions": [
+                    "main_code에 generate_strands_agent 결과의 data.main_code를 전달하거나",
+                    "requirements로 측정할 프로젝트를 생성하세요."
+                ]
             }
-        
+        generated = generate_strands_agent.__wrapped__(
+            requirements,
+            agent_type=agent_type,
+            aws_services=aws_services,
+            deployment_target=deployment_target,
+            provisioned_concurrency=provisioned_concurrency,
+            snap_start=snap_start
+        )
+        if not generated["success"]:
+            return generated
+        main_code = generated["data"]["main_code"]
+
+    try:
+        with tempfile.TemporaryDirectory(prefix="strands-profile-") as project_dir:
+            project = Path(project_dir)
+            (project / "main.py").write_text(main_code, encoding="utf-8")
+            runner = project / "_profile_runner.py"
+            runner.write_text(PROFILE_RUNNER, encoding="utf-8")
+
+            command = [sys.executable, "-X", "importtime", "_profile_runner.py"]
+            if use_stubs:
+                (project / PROFILE_STUB_MODULE.name).write_text(
+                    PROFILE_STUB_MODULE.read_text(encoding="utf-8"), encoding="utf-8"
+                )
+                command.append("--stubs")
+
+            completed = subprocess.run(
+                command,
+                cwd=project_dir,
+                env=profile_environment(initialization_type),
+                capture_output=True,
+                text=True,
+                timeout=PROFILE_TIMEOUT_S
+            )
+
+        marker = next(
+            (
+                line for line in completed.stdout.splitlines()
+                if line.startswith("__PROFILE__")
+            ),
+            None
+        )
+        if completed.returncode != 0 or marker is None:
+            errors = [
+                line for line in completed.stderr.splitlines()
+                if not line.startswith("import time:")
+                and line not in (LAZY_INIT_START, LAZY_INIT_END)
+            ]
+            return {
+                "success": False,
+                "error": "생성된 main.py를 import하지 못했습니다.",
+                "error_type": "ImportFailed",
+                "stderr": "\n".join(errors[-20:]),
+                "suggestions": [
+                    "use_stubs=True로 대역 패키지를 사용하거나",
+                    "requirements.txt의 패키지를 설치한 환경에서 use_stubs=False로 측정하세요."
+                ]
+            }
+
+        measured = json.loads(marker[len("__PROFILE__"):])
+        issues = find_cold_start_issues(main_code)
+        mb = 1024 * 1024
+
+        lazy_init = parse_lazy_init_imports(completed.stderr)
+        if lazy_init is not None and "lazy_init_s" in measured:
+            lazy_init["total_ms"] = round(measured["lazy_init_s"] * 1000, 2)
+
         return {
             "success": True,
             "data": {
-                "main_code": main_code,
-                "requirements_txt": requirements_txt,
-                "readme_md": readme,
-                "deployment_config": deployment_config
+                "import_time": parse_import_times(completed.stderr),
+                "import_wall_ms": round(measured["import_s"] * 1000, 2),
+                "lazy_init": lazy_init,
+                "baseline_rss_mb": round(measured["baseline_rss_bytes"] / mb, 1),
+                "peak_rss_mb": round(measured["peak_rss_bytes"] / mb, 1),
+                "cold_start_issues": issues
             },
             "metadata": {
-                "timestamp": datetime.now().isoformat(),
-                "version": "1.0.0",
-                "analysis": analysis,
-                "based_on": "크롤링한 실제 Strands Agent 예시"
+                "packages": "stubs" if use_stubs else "installed",
+                "python": sys.version.split()[0],
+                "initialization_type": initialization_type,
+                "measured_at": datetime.now().isoformat()
             }
         }
-        
+
+    except subprocess.TimeoutExpired:
+        return {
+            "success": False,
+            "error": f"{PROFILE_TIMEOUT_S}초 안에 import가 끝나지 않았습니다.",
+            "error_type": "TimeoutExpired"
+        }
     except Exception as e:
         return {
             "success": False,
-            "error": f"코드 생성 중 오류: {str(e)}",
+            "error": f"프로파일링 중 오류: {str(e)}",
             "error_type": type(e).__name__
         }
 
 
 @mcp.tool()
-def get_strands_examples() -> str:
+@offload()
+def get_strands_examples(query: Optional[str] = None) -> str:
     """
     크롤링한 Strands Agent 예시들을 제공합니다.
     
     실제 애플리케이션 예시를 통해 어떤 종류의 에이전트를 
     만들 수 있는지 확인할 수 있습니다.
-    """
-    
-    examples = """
-# 크롤링한 실제 Strands Agent 예시들
-
-## 1. 비즈니스 애플리케이션
-- **레스토랑 어시스턴트**: 주문 처리, 메뉴 관리, 예약 시스템
-- **개인 비서**: 일정 관리, 이메일 처리, 검색 기능
-- **스크럼 마스터**: 프로젝트 관리, 회의 노트, 작업 추적
-
-## 2. 금융 서비스
-- **개인 금융 어시스턴트**: 예산 관리, 투자 분석, 지출 추적
-- **금융 분석 스웜**: 주식 분석, 시장 데이터, 리스크 평가
-- **WhatsApp 핀테크**: 모바일 결제, 송금, 계좌 조회
-
-## 3. 기술 지원
-- **코드 어시스턴트**: 코드 리뷰, 버그 수정, 문서 생성
-- **AWS 감사 어시스턴트**: 리소스 모니터링, 비용 분석, 보안 검사
-- **데이터 웨어하우스 최적화**: 쿼리 최적화, 성능 분석
-
-## 4. 의료 및 전문 서비스
-- **의료 문서 처리**: 진료 기록, 처방전, 보험 청구
-- **멀티모달 이메일 어시스턴트**: 이미지 분석, 문서 처리
 
-## 5. 데이터 분석
-- **게임 판매 분석**: 매출 분석, 트렌드 예측
-- **HVAC 데이터 분석**: IoT 데이터, 에너지 효율성
+    Args:
+        query: 지정하면 샘플 모음에서 가장 가까운 실제 예시들을 반환
+    """
 
-이 예시들을 참고하여 원하는 에이전트를 요청하세요!
-"""
+    if query:
+        matches = select_examples(query)
+        if matches:
+            return "\n\n".join(
+                f"## {match['title']} (유사도 {match['score']})\n{match['excerpt']}"
+                for match in matches
+            )
     
-    return examples
+    return crawling_resources["examples"].text
 
 
 @mcp.tool()
+@offload()
 def get_strands_guide() -> str:
     """
     크롤링한 완전한 Strands Agents 가이드를 제공합니다.
@@ -545,9 +2876,26 @@ print(response)
 """
 
 
+@mcp.tool()
+def get_execution_metrics() -> Dict[str, Any]:
+    """
+    동기 도구 실행 계층의 도구별 지표를 제공합니다.
+
+    실행/대기 중인 호출 수, 완료/실패/거절(busy) 건수와 함께
+    최근 호출의 대기 시간과 실행 시간 분포(ms)를 따로 반환합니다.
+    """
+
+    return {
+        "success": True,
+        "executor_workers": TOOL_EXECUTOR_WORKERS,
+        "tools": {name: metrics.snapshot() for name, metrics in _tool_metrics.items()}
+    }
+
+
 def main() -> None:
     """MCP 서버를 실행합니다."""
     print("🚀 Strands Agent 자동 생성 MCP 서버 시작...")
+    get_example_index()
     mcp.run()
 
 
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""generate_strands_agent 코드 생성 테스트"""
+
+import ast
+
+from strands_agent_generator_mcp import generate_strands_agent
+
+# MCP 도구는 스레드 풀 실행 래퍼(비동기)로 등록되므로 원래 동기 함수를 호출
+generate = generate_strands_agent.__wrapped__
+
+AGENT_TYPES = ["basic", "multi_agent", "conversational"]
+DEPLOYMENT_TARGETS = ["lambda", "ecs", "local"]
+QUOTED_REQUIREMENTS = 'S3에 "주문" 저장 """메모""" 경로 C:\\orders\\new {id}'
+
+
+def test_quoted_requirements_generate_valid_code() -> None:
+    """따옴표, 백슬래시, 중괄호가 든 요구사항도 모든 조합에서 문법이 올바른 코드가 됩니다."""
+    for agent_type in AGENT_TYPES:
+        for target in DEPLOYMENT_TARGETS:
+            result = generate(
+                QUOTED_REQUIREMENTS,
+                agent_type=agent_type,
+                deployment_target=target
+            )
+            assert result["success"], (agent_type, target, result.get("error"))
+            tree = ast.parse(result["data"]["main_code"])
+            docstring = ast.get_docstring(tree)
+            assert docstring.startswith(QUOTED_REQUIREMENTS), (agent_type, target)
+
+
+def test_quoted_requirements_are_printed_verbatim() -> None:
+    """로컬 실행 코드의 목적 출력은 요구사항을 그대로 담은 문자열 리터럴입니다."""
+    result = generate(
+        QUOTED_REQUIREMENTS, agent_type="basic", deployment_target="local"
+    )
+    literals = [
+        node.value for node in ast.walk(ast.parse(result["data"]["main_code"]))
+        if isinstance(node, ast.Constant) and node.value == QUOTED_REQUIREMENTS
+    ]
+    assert literals
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
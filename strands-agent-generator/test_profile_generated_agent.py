@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""profile_generated_agent 콜드 스타트 측정 테스트"""
+
+import os
+
+from strands_agent_generator_mcp import (
+    LAZY_INIT_END,
+    LAZY_INIT_START,
+    parse_import_times,
+    parse_lazy_init_imports,
+    profile_environment,
+)
+
+IMPORTTIME_STDERR = "\n".join([
+    "import time: self [us] | cumulative | imported package",
+    "import time:       300 |        300 |     json.decoder",
+    "import time:       200 |        500 |   json",
+    "import time:      1000 |       1500 | main",
+    LAZY_INIT_START,
+    "import time:       400 |        400 |     botocore.session",
+    "import time:       600 |       1000 |   botocore",
+    "import time:      2000 |       3000 | boto3",
+    "import time:       700 |        700 | strands",
+    "import time:       100 |        100 | strands.models",
+    LAZY_INIT_END,
+    "import time:        50 |         50 | json.encoder",
+])
+
+
+def test_module_import_stops_at_lazy_init() -> None:
+    """main의 import 분해에는 지연 초기화 구간이 섞이지 않습니다."""
+    result = parse_import_times(IMPORTTIME_STDERR)
+    assert result["total_ms"] == 1.5
+    assert result["module_init_ms"] == 1.0
+    assert result["by_package"] == [{"package": "json", "cumulative_ms": 0.5}]
+
+
+def test_lazy_init_imports_by_package() -> None:
+    """get_agent() 구간의 최상위 import를 패키지별로 합산합니다."""
+    result = parse_lazy_init_imports(IMPORTTIME_STDERR)
+    assert result["imports_ms"] == 3.8
+    assert result["by_package"] == [
+        {"package": "boto3", "cumulative_ms": 3.0},
+        {"package": "strands", "cumulative_ms": 0.8},
+    ]
+    assert parse_lazy_init_imports("import time:  1 |  1 | main") is None
+
+
+def test_profile_environment_drops_aws_credentials() -> None:
+    """하위 프로세스에는 AWS 자격 증명과 프로필이 전달되지 않습니다."""
+    saved = dict(os.environ)
+    os.environ.update({
+        "AWS_ACCESS_KEY_ID": "AKIAEXAMPLE",
+        "AWS_SECRET_ACCESS_KEY": "secret",
+        "AWS_SESSION_TOKEN": "token",
+        "AWS_PROFILE": "prod",
+        "AWS_REGION": "eu-west-1",
+    })
+    try:
+        env = profile_environment("on-demand")
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+    for key in (
+        "AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN", "AWS_PROFILE"
+    ):
+        assert key not in env, key
+    assert env["AWS_REGION"] == env["AWS_DEFAULT_REGION"] == "eu-west-1"
+    assert env["AWS_SHARED_CREDENTIALS_FILE"] == os.devnull
+    assert env["AWS_LAMBDA_INITIALIZATION_TYPE"] == "on-demand"
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""validate_agent_code 검증 규칙 테스트"""
+
+from typing import Any, Dict, List
+
+from strands_agent_generator_mcp import (
+    MAX_LINE_LENGTH,
+    analyze_agent_source,
+    validate_agent_code
+)
+
+# MCP 도구는 스레드 풀 실행 래퍼(비동기)로 등록되므로 원래 동기 함수를 호출
+validate = validate_agent_code.__wrapped__
+
+TOOLS_MODULE = '''from strands import tool
+
+
+@tool
+def lookup_order(order_id: str) -> str:
+    """주문 상태를 조회합니다."""
+    return order_id
+'''
+
+MAIN_MODULE = '''from strands import Agent
+
+from tools import lookup_order
+
+TOOLS = [lookup_order]
+
+
+def create_agent() -> Agent:
+    """에이전트를 생성합니다."""
+    return Agent(tools=TOOLS)
+'''
+
+
+def rules(issues: List[Dict[str, Any]], severity: str = "") -> List[str]:
+    """이슈 목록의 규칙 이름 (severity를 주면 해당 심각도만)"""
+    return [
+        issue["rule"] for issue in issues
+        if not severity or issue["severity"] == severity
+    ]
+
+
+def test_valid_single_file() -> None:
+    """정상 코드는 이슈가 없습니다."""
+    source = TOOLS_MODULE.replace(
+        "from strands import tool", "from strands import Agent, tool"
+    )
+    source += "\n\nagent = Agent(tools=[lookup_order])\n"
+    result = validate(source)
+    assert result["success"] and result["data"]["valid"]
+    assert result["data"]["files"]["main.py"]["issues"] == []
+    assert result["data"]["project_issues"] == []
+
+
+def test_syntax_error() -> None:
+    """문법 오류는 다른 검사 없이 error로 보고됩니다."""
+    issues = analyze_agent_source("def broken(:\n    pass\n")["issues"]
+    assert rules(issues) == ["syntax"]
+
+
+def test_tab_and_line_length() -> None:
+    """탭은 error, 긴 줄은 warning입니다."""
+    source = f"x = 1\n\ty = 2\nz = '{'a' * MAX_LINE_LENGTH}'\n"
+    issues = analyze_agent_source(source)["issues"]
+    assert "tab" in rules(issues, "error")
+    assert "line-length" in rules(issues, "warning")
+
+
+def test_naming() -> None:
+    """snake_case가 아닌 함수 이름은 error입니다."""
+    issues = analyze_agent_source("def fetchData() -> None:\n    pass\n")["issues"]
+    assert rules(issues, "error") == ["naming"]
+
+
+def test_type_hints() -> None:
+    """타입 힌트 누락은 도구에서는 error, 일반 함수에서는 warning입니다."""
+    source = '''from strands import tool
+
+
+@tool
+def search(query):
+    """검색합니다."""
+    return query
+
+
+def helper(value):
+    return value
+'''
+    issues = analyze_agent_source(source)["issues"]
+    tool_issues = [issue for issue in issues if "'search'" in issue["message"]]
+    helper_issues = [issue for issue in issues if "'helper'" in issue["message"]]
+    assert set(rules(tool_issues)) == {"type-hints"}
+    assert {issue["severity"] for issue in tool_issues} == {"error"}
+    assert {issue["severity"] for issue in helper_issues} == {"warning"}
+
+
+def test_tool_docstring_and_implicit_optional() -> None:
+    """도구 docstring 누락은 error, None 기본값의 비-Optional 타입은 warning입니다."""
+    source = '''from typing import Optional
+
+from strands import tool
+
+
+@tool
+def fetch(key: str, prefix: str = None) -> str:
+    return key
+
+
+@tool
+def fetch_optional(key: str, prefix: Optional[str] = None) -> str:
+    """prefix가 Optional이면 경고가 없습니다."""
+    return key
+'''
+    issues = analyze_agent_source(source)["issues"]
+    assert rules(issues, "error") == ["tool-docstring"]
+    warnings = [issue for issue in issues if issue["severity"] == "warning"]
+    assert rules(warnings) == ["implicit-optional"]
+    assert "'fetch'" in warnings[0]["message"] and "'prefix'" in warnings[0]["message"]
+
+
+def test_strands_import_tool_module_needs_only_tool() -> None:
+    """@tool만 정의하는 도구 모듈은 Agent import 없이도 유효합니다."""
+    assert analyze_agent_source(TOOLS_MODULE)["issues"] == []
+
+
+def test_strands_import_missing() -> None:
+    """@tool 정의에는 tool, Agent(...) 호출에는 Agent import가 필요합니다."""
+    missing_tool = TOOLS_MODULE.replace("from strands import tool\n", "")
+    issues = analyze_agent_source(missing_tool)["issues"]
+    assert rules(issues, "error") == ["strands-import"]
+
+    missing_agent = MAIN_MODULE.replace(
+        "from strands import Agent\n", "from strands import tool\n"
+    )
+    issues = analyze_agent_source(missing_agent)["issues"]
+    assert rules(issues, "error") == ["strands-import"]
+    agent_call = MAIN_MODULE.splitlines().index("    return Agent(tools=TOOLS)")
+    assert issues[0]["line"] == agent_call + 1
+
+
+def test_project_with_tools_module_is_valid() -> None:
+    """tools.py + main.py 프로젝트는 파일 간 도구 등록까지 유효합니다."""
+    result = validate(files={"tools.py": TOOLS_MODULE, "main.py": MAIN_MODULE})
+    assert result["data"]["valid"], result["data"]
+    assert result["data"]["project_issues"] == []
+    assert result["data"]["files"]["tools.py"]["tools"] == ["lookup_order"]
+
+
+def test_tool_registration() -> None:
+    """등록되지 않은 도구는 warning, 정의되지 않은 등록 도구는 error입니다."""
+    unregistered = TOOLS_MODULE.replace(
+        "from strands import tool", "from strands import Agent, tool"
+    )
+    unregistered += "\n\nagent = Agent(tools=[])\n"
+    result = validate(unregistered)
+    assert rules(result["data"]["project_issues"]) == ["tool-registration"]
+    assert result["data"]["valid"]
+
+    undefined = "from strands import Agent\n\nagent = Agent(tools=[missing_tool])\n"
+    result = validate(undefined)
+    assert rules(result["data"]["project_issues"], "error") == ["tool-registration"]
+    assert not result["data"]["valid"]
+
+
+def test_tool_registration_through_list_name() -> None:
+    """Agent(tools=TOOLS)는 같은 파일의 TOOLS = [...] 목록으로 등록을 확인합니다."""
+    assert analyze_agent_source(MAIN_MODULE)["registered_tools"] == ["lookup_order"]
+
+
+def test_results_are_cached_by_hash() -> None:
+    """같은 내용의 파일은 두 번째 검증에서 캐시를 사용합니다."""
+    source = TOOLS_MODULE + "\n# cache test\n"
+    first = validate(source)
+    second = validate(source)
+    assert not first["data"]["files"]["main.py"]["cached"]
+    assert second["data"]["files"]["main.py"]["cached"]
+    assert second["metadata"]["cache_hits"] == 1
+
+
+def test_empty_input() -> None:
+    """검증할 코드가 없으면 오류 응답을 반환합니다."""
+    result = validate(files={"README.md": "# 문서"})
+    assert not result["success"]
+    assert result["suggestions"]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,141 @@
+"""Compares snippet extraction on saved pages: full BeautifulSoup vs streaming parsers.
+
+    python benchmark_extract.py [--repeat 20] [--chunk-size 16384] [fixtures/*.html]
+
+CPU time is process_time() per page (median of --repeat runs). Peak memory is
+measured in a fresh subprocess per extractor and page: the growth of the process
+high-water RSS over the RSS right before a single run, so libxml2's own buffers are
+counted as well as the Python heap (Linux only; the column shows n/a elsewhere).
+Streaming extractors get the page in --chunk-size pieces, the way
+crawl_strands_info reads the response body.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union
+
+from bs4 import BeautifulSoup
+
+from extract import (
+    MAX_HTML_BYTES,
+    SNIPPET_LIMIT,
+    LxmlSnippetExtractor,
+    StdlibSnippetExtractor,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def extract_bs4(html: bytes, chunk_size: int) -> List[str]:
+    """The previous crawl_strands_info extraction: whole page, full tree, find_all."""
+    soup = BeautifulSoup(html.decode("utf-8", errors="replace"), 'html.parser')
+    snippets = []
+    for div in soup.find_all('div', class_=['BNeawe', 'VwiC3b']):
+        text = div.get_text().strip()
+        if text and 'strand' in text.lower():
+            snippets.append(text)
+    return snippets[:SNIPPET_LIMIT]
+
+
+def streaming(
+    extractor_class: Type[Union[LxmlSnippetExtractor, StdlibSnippetExtractor]],
+) -> Callable[[bytes, int], List[str]]:
+    def run(html: bytes, chunk_size: int) -> List[str]:
+        extractor = extractor_class("utf-8")
+        for offset in range(0, min(len(html), MAX_HTML_BYTES), chunk_size):
+            extractor.feed(html[offset:min(offset + chunk_size, MAX_HTML_BYTES)])
+            if extractor.done:
+                break
+        return extractor.close()
+
+    return run
+
+
+EXTRACTORS: Dict[str, Callable[[bytes, int], List[str]]] = {
+    "bs4 html.parser (full)": extract_bs4,
+    "lxml pull (streaming)": streaming(LxmlSnippetExtractor),
+    "html.parser (streaming)": streaming(StdlibSnippetExtractor),
+}
+
+
+def read_status_kib(field: str) -> int:
+    """Reads a `VmRSS`/`VmHWM`-style field from /proc/self/status, in KiB."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    raise KeyError(field)
+
+
+def peak_rss_growth(name: str, path: Path, chunk_size: int) -> int:
+    """Runs one extraction in this (fresh) process; returns peak RSS growth in KiB."""
+    html = path.read_bytes()
+    extract = EXTRACTORS[name]
+    # Writing 5 to clear_refs resets VmHWM, so imports and reading the page don't count.
+    with open("/proc/self/clear_refs", "w") as f:
+        f.write("5")
+    baseline = read_status_kib("VmRSS")
+    extract(html, chunk_size)
+    return read_status_kib("VmHWM") - baseline
+
+
+def measure_rss(name: str, path: Path, chunk_size: int) -> Optional[int]:
+    """Measures one extraction's peak RSS growth in a child; None if unavailable."""
+    command = [
+        sys.executable, __file__, "--rss", name,
+        "--chunk-size", str(chunk_size), str(path),
+    ]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    return int(completed.stdout) if completed.returncode == 0 else None
+
+
+def measure(
+    name: str, path: Path, html: bytes, chunk_size: int, repeat: int
+) -> Tuple[List[str], float, Optional[int]]:
+    extract = EXTRACTORS[name]
+    cpu_times = []
+    for _ in range(repeat):
+        started = time.process_time()
+        snippets = extract(html, chunk_size)
+        cpu_times.append(time.process_time() - started)
+    cpu_ms = statistics.median(cpu_times) * 1000
+    return snippets, cpu_ms, measure_rss(name, path, chunk_size)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixtures", nargs="*", type=Path)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--chunk-size", type=int, default=16 * 1024)
+    # Subprocess mode used by measure_rss.
+    parser.add_argument("--rss", choices=EXTRACTORS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.rss:
+        print(peak_rss_growth(args.rss, args.fixtures[0], args.chunk_size))
+        return
+
+    paths = args.fixtures or sorted(FIXTURES_DIR.glob("*.html"))
+    print(f"{'fixture':<22} {'extractor':<24} {'KiB':>6} {'CPU ms':>8} "
+          f"{'peak RSS KiB':>12}  snippets")
+    for path in paths:
+        html = path.read_bytes()
+        baseline = None
+        for name in EXTRACTORS:
+            snippets, cpu_ms, peak_kib = measure(
+                name, path, html, args.chunk_size, args.repeat
+            )
+            if baseline is None:
+                baseline = snippets
+            note = "" if snippets == baseline else "  (differs from bs4)"
+            peak = "n/a" if peak_kib is None else str(peak_kib)
+            print(f"{path.name:<22} {name:<24} {len(html) / 1024:>6.0f} "
+                  f"{cpu_ms:>8.2f} {peak:>12}  {len(snippets)}{note}")
+
+
+if __name__ == "__main__":
+    main()
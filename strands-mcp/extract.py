@@ -0,0 +1,147 @@
+import codecs
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple, Union
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - lxml is a declared dependency
+    etree = None
+
+# Google result snippet containers, and the keyword a snippet must mention.
+SNIPPET_CLASSES = frozenset({"BNeawe", "VwiC3b"})
+SNIPPET_KEYWORD = "strand"
+SNIPPET_LIMIT = 3
+# Stop reading the response body after this many bytes, even with fewer snippets.
+MAX_HTML_BYTES = 512 * 1024
+
+
+def is_snippet_div(tag: str, class_attr: Optional[str]) -> bool:
+    return (
+        tag == "div"
+        and bool(class_attr)
+        and not SNIPPET_CLASSES.isdisjoint(class_attr.split())
+    )
+
+
+def keep_snippet(text: str) -> bool:
+    return bool(text) and SNIPPET_KEYWORD in text.lower()
+
+
+class LxmlSnippetExtractor:
+    """Incremental extractor on lxml's HTMLPullParser.
+
+    Elements outside snippet divs are cleared as soon as they close, so memory stays
+    bounded by the largest open snippet rather than the whole document.
+    """
+
+    parser_name = "lxml"
+
+    def __init__(
+        self, encoding: Optional[str] = None, limit: int = SNIPPET_LIMIT
+    ) -> None:
+        self.parser = etree.HTMLPullParser(
+            events=("start", "end"), encoding=encoding, recover=True
+        )
+        self.limit = limit
+        self.snippets: List[str] = []
+        self.open_snippets = 0
+
+    @property
+    def done(self) -> bool:
+        return len(self.snippets) >= self.limit
+
+    def feed(self, chunk: bytes) -> None:
+        self.parser.feed(chunk)
+        self.drain()
+
+    def close(self) -> List[str]:
+        if not self.done:
+            try:
+                self.parser.close()
+            except etree.XMLSyntaxError:
+                pass
+            self.drain()
+        return self.snippets[:self.limit]
+
+    def drain(self) -> None:
+        for event, element in self.parser.read_events():
+            if self.done:
+                continue
+            matched = is_snippet_div(element.tag, element.get("class"))
+            if event == "start":
+                self.open_snippets += matched
+                continue
+
+            if matched:
+                self.open_snippets -= 1
+                text = "".join(element.itertext()).strip()
+                if keep_snippet(text):
+                    self.snippets.append(text)
+            if not self.open_snippets:
+                element.clear(keep_tail=True)
+                parent = element.getparent()
+                while parent is not None and element.getprevious() is not None:
+                    del parent[0]
+
+
+class StdlibSnippetExtractor(HTMLParser):
+    """Incremental extractor on html.parser, used when lxml is unavailable."""
+
+    parser_name = "html.parser"
+
+    def __init__(
+        self, encoding: Optional[str] = None, limit: int = SNIPPET_LIMIT
+    ) -> None:
+        super().__init__(convert_charrefs=True)
+        decoder_class = codecs.getincrementaldecoder(encoding or "utf-8")
+        self.decoder = decoder_class(errors="replace")
+        self.limit = limit
+        self.snippets: List[str] = []
+        # One entry per open div: text parts for snippet divs, None otherwise.
+        self.div_stack: List[Optional[List[str]]] = []
+
+    @property
+    def done(self) -> bool:
+        return len(self.snippets) >= self.limit
+
+    def feed(self, chunk: bytes) -> None:
+        super().feed(self.decoder.decode(chunk))
+
+    def close(self) -> List[str]:
+        if not self.done:
+            super().feed(self.decoder.decode(b"", final=True))
+            super().close()
+        return self.snippets[:self.limit]
+
+    def handle_starttag(
+        self, tag: str, attrs: List[Tuple[str, Optional[str]]]
+    ) -> None:
+        if tag == "div":
+            matched = is_snippet_div(tag, dict(attrs).get("class"))
+            self.div_stack.append([] if matched else None)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag != "div" or not self.div_stack:
+            return
+        parts = self.div_stack.pop()
+        if parts is not None and not self.done:
+            text = "".join(parts).strip()
+            if keep_snippet(text):
+                self.snippets.append(text)
+
+    def handle_data(self, data: str) -> None:
+        for parts in self.div_stack:
+            if parts is not None:
+                parts.append(data)
+
+
+SnippetExtractor = Union[LxmlSnippetExtractor, StdlibSnippetExtractor]
+
+
+def make_extractor(
+    encoding: Optional[str] = None, limit: int = SNIPPET_LIMIT
+) -> SnippetExtractor:
+    """Returns the fastest available incremental snippet extractor."""
+    if etree is not None:
+        return LxmlSnippetExtractor(encoding, limit)
+    return StdlibSnippetExtractor(encoding, limit)
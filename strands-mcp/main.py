@@ -1,52 +1,169 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
 import httpx
-from bs4 import BeautifulSoup
 from fastmcp import FastMCP
 
+from extract import MAX_HTML_BYTES, make_extractor
+from tool_executor import metrics_snapshot, offload
+from tracing import SPAN_KIND_CLIENT, httpx_trace_hook, span
+
 mcp = FastMCP("Strands Code Generator")
 
-@mcp.tool()
-def crawl_strands_info(query: str) -> str:
-    """Crawl strands information from internet"""
+
+@contextmanager
+def fetch(
+    client: httpx.Client, url: str, headers: Dict[str, str]
+) -> Iterator[httpx.Response]:
+    """Opens a streaming GET for `url`; the span times each transport phase.
+
+    httpcore reports no separate DNS phase, so name resolution is part of
+    `connection.connect_tcp`.
+    """
+    attributes = {"http.request.method": "GET", "url.full": url}
+    with span("fetch", SPAN_KIND_CLIENT, **attributes) as fetch_span:
+        request = client.build_request(
+            "GET", url, headers=headers, timeout=10,
+            extensions={"trace": httpx_trace_hook(fetch_span)},
+        )
+        response = client.send(request, stream=True)
+        fetch_span.set_attribute("http.response.status_code", response.status_code)
     try:
-        search_url = f"https://www.google.com/search?q={query}+strands"
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        
-        with httpx.Client() as client:
-            response = client.get(search_url, headers=headers, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            snippets = []
-            for div in soup.find_all('div', class_=['BNeawe', 'VwiC3b']):
-                text = div.get_text().strip()
-                if text and 'strand' in text.lower():
-                    snippets.append(text)
-            
-            return "\n".join(snippets[:3]) if snippets else "No strands info found"
-    except Exception as e:
-        return f"Error: {str(e)}"
+        yield response
+    finally:
+        response.close()
 
-@mcp.tool()
-def generate_strands_code(info: str, language: str = "python") -> str:
-    """Generate code based on strands information"""
-    if language == "python":
-        return f'''class Strand:
+
+def extract_snippets(response: httpx.Response) -> List[str]:
+    """Parses the body as it arrives, up to SNIPPET_LIMIT snippets or MAX_HTML_BYTES.
+
+    Reading and parsing alternate chunk by chunk, so they cannot be two back-to-back
+    spans. The `parse` child runs from the first feed to close(); its `parse.busy_ms`
+    is the time spent inside the parser, and `read.wait_ms` on `extract` is the time
+    spent waiting for body chunks.
+    """
+    extractor = make_extractor(response.charset_encoding)
+    attributes = {"parser": extractor.parser_name, "html.byte_cap": MAX_HTML_BYTES}
+    with span("extract", **attributes) as extract_span:
+        received = 0
+        stop_reason = "eof"
+        parse_started = 0
+        parse_ns = read_ns = 0
+        chunks = response.iter_bytes()
+        while True:
+            read_started = time.perf_counter_ns()
+            chunk = next(chunks, None)
+            read_ns += time.perf_counter_ns() - read_started
+            if chunk is None:
+                break
+
+            parse_started = parse_started or time.time_ns()
+            feed_started = time.perf_counter_ns()
+            extractor.feed(chunk[:MAX_HTML_BYTES - received])
+            parse_ns += time.perf_counter_ns() - feed_started
+            received = min(received + len(chunk), MAX_HTML_BYTES)
+            if extractor.done:
+                stop_reason = "snippets"
+                break
+            if received >= MAX_HTML_BYTES:
+                stop_reason = "byte_cap"
+                break
+
+        parse_started = parse_started or time.time_ns()
+        close_started = time.perf_counter_ns()
+        snippets = extractor.close()
+        parse_ns += time.perf_counter_ns() - close_started
+        extract_span.add_child(
+            "parse", parse_started, time.time_ns(),
+            parser=extractor.parser_name,
+            **{"parse.busy_ms": round(parse_ns / 1e6, 3), "html.bytes": received},
+        )
+
+        extract_span.set_attribute("read.wait_ms", round(read_ns / 1e6, 3))
+        extract_span.set_attribute("html.bytes", received)
+        extract_span.set_attribute(
+            "http.response.wire_bytes", response.num_bytes_downloaded
+        )
+        extract_span.set_attribute("stop_reason", stop_reason)
+        extract_span.set_attribute("snippets.found", len(snippets))
+        snippet_bytes = sum(len(s.encode()) for s in snippets)
+        extract_span.set_attribute("snippets.bytes", snippet_bytes)
+        return snippets
+
+
+def crawl(query: str) -> str:
+    """Searches the web for strands information and returns up to three snippets."""
+    with span("crawl", query=query) as crawl_span:
+        try:
+            search_url = f"https://www.google.com/search?q={query}+strands"
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                              'AppleWebKit/537.36'
+            }
+
+            with httpx.Client() as client:
+                with fetch(client, search_url, headers) as response:
+                    snippets = extract_snippets(response)
+
+            return "\n".join(snippets) if snippets else "No strands info found"
+        except Exception as e:
+            # The failing stage (connect_tcp, start_tls, extract, ...) marks its span.
+            crawl_span.record_exception(e)
+            return f"Error: {type(e).__name__}: {e} (trace {crawl_span.trace_id})"
+
+
+def generate_code(info: str, language: str = "python") -> str:
+    """Renders example code for the given strands information."""
+    attributes = {"language": language, "info.bytes": len(info.encode())}
+    with span("generate", **attributes) as generate_span:
+        if language == "python":
+            code = f'''class Strand:
     def __init__(self, data):
         self.data = data
-    
+
     def process(self):
         # Based on: {info[:50]}...
         return self.data.split()
 
 strand = Strand("{info[:30]}...")'''
-    else:
-        return f"// {language} code for: {info[:50]}..."
+        else:
+            code = f"// {language} code for: {info[:50]}..."
+        generate_span.set_attribute("code.bytes", len(code.encode()))
+        return code
+
+
+@mcp.tool()
+@offload(max_concurrency=2, max_queue=8)
+def crawl_strands_info(query: str) -> str:
+    """Crawl strands information from internet"""
+    with span("crawl_strands_info"):
+        return crawl(query)
+
 
 @mcp.tool()
+@offload()
+def generate_strands_code(info: str, language: str = "python") -> str:
+    """Generate code based on strands information"""
+    with span("generate_strands_code"):
+        return generate_code(info, language)
+
+
+@mcp.tool()
+@offload(max_concurrency=2, max_queue=8)
 def auto_strands_workflow(query: str, language: str = "python") -> str:
     """Complete workflow: crawl and generate code"""
-    info = crawl_strands_info(query)
-    code = generate_strands_code(info, language)
-    return f"INFO:\n{info}\n\nCODE:\n{code}"
+    with span("auto_strands_workflow", query=query, language=language):
+        info = crawl(query)
+        code = generate_code(info, language)
+        return f"INFO:\n{info}\n\nCODE:\n{code}"
+
+
+@mcp.tool()
+def get_execution_metrics() -> Dict[str, Any]:
+    """Per-tool running/queued/busy/cancelled counts and queue-wait vs run-time (ms)"""
+    return metrics_snapshot()
+
 
 if __name__ == "__main__":
     mcp.run()
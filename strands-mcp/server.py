@@ -1,11 +1,138 @@
+import base64
+import binascii
+from typing import List, Optional, Union
+
+import numpy as np
 from fastmcp import FastMCP
+from fastmcp.exceptions import ToolError
 
 mcp = FastMCP("Strands_MPC_Server")
 
+# Arrays are passed as JSON lists or base64-encoded little-endian float64 buffers.
+Array = Union[List[float], str]
+# Non-finite results (e.g. division by zero) become null in list and scalar form.
+ResultArray = Union[List[Optional[float]], str]
+
+MAX_ELEMENTS = 10_000_000
+
+ELEMENTWISE_OPS = {
+    "add": np.add,
+    "subtract": np.subtract,
+    "multiply": np.multiply,
+    "divide": np.divide,
+    "power": np.power,
+    "minimum": np.minimum,
+    "maximum": np.maximum,
+}
+
+REDUCE_OPS = {
+    "sum": np.sum,
+    "prod": np.prod,
+    "mean": np.mean,
+    "min": np.min,
+    "max": np.max,
+    "std": np.std,
+}
+
+
+def decode_array(values: Union[Array, float], name: str) -> np.ndarray:
+    """Decodes a JSON list, base64 float64 buffer or scalar into a float64 array."""
+    if isinstance(values, str):
+        try:
+            raw = base64.b64decode(values, validate=True)
+        except binascii.Error as e:
+            raise ToolError(f"{name}: invalid base64 ({e})")
+        if len(raw) % 8:
+            raise ToolError(
+                f"{name}: buffer length {len(raw)} is not a multiple of 8 bytes"
+            )
+        array = np.frombuffer(raw, dtype="<f8")
+    else:
+        array = np.asarray(values, dtype=np.float64)
+
+    if array.ndim > 1:
+        raise ToolError(f"{name}: expected a flat array, got shape {array.shape}")
+    if array.size > MAX_ELEMENTS:
+        raise ToolError(
+            f"{name}: {array.size} elements exceeds the limit of {MAX_ELEMENTS}"
+        )
+    return array
+
+
+def encode_array(array: np.ndarray, as_base64: bool) -> ResultArray:
+    """Encodes a result array like the input: base64 float64 buffer or JSON list."""
+    array = np.asarray(array, dtype="<f8")
+    if as_base64:
+        return base64.b64encode(array.tobytes()).decode("ascii")
+    values = array.tolist()
+    for index in np.flatnonzero(~np.isfinite(array)).tolist():
+        values[index] = None
+    return values
+
+
+def encode_scalar(value: np.floating) -> Optional[float]:
+    """Returns a JSON-safe float, or None for inf/nan (which JSON cannot represent)."""
+    return float(value) if np.isfinite(value) else None
+
+
 @mcp.tool
 def multiply(a: float, b: float) -> float:
     """Multiplies two numbers together."""
     return a * b
 
+
+@mcp.tool
+def batch_elementwise(op: str, a: Array, b: Union[Array, float]) -> ResultArray:
+    """Applies add, subtract, multiply, divide, power, minimum or maximum element-wise.
+
+    `a` and `b` are JSON lists of numbers or base64-encoded little-endian float64
+    buffers of equal length; `b` may also be a single number applied to every
+    element. The result uses the same encoding as `a`.
+    """
+    if op not in ELEMENTWISE_OPS:
+        raise ToolError(f"Unknown op '{op}'. Supported: {', '.join(ELEMENTWISE_OPS)}")
+
+    left = decode_array(a, "a")
+    right = decode_array(b, "b")
+    if right.ndim == 1 and right.size != left.size:
+        raise ToolError(f"a has {left.size} elements but b has {right.size}")
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        result = ELEMENTWISE_OPS[op](left, right)
+    return encode_array(result, isinstance(a, str))
+
+
+@mcp.tool
+def batch_reduce(op: str, values: Array) -> Optional[float]:
+    """Reduces an array with sum, prod, mean, min, max or std.
+
+    `values` is a JSON list of numbers or a base64-encoded little-endian float64 buffer.
+    Returns null when the result is not finite (overflow or nan input).
+    """
+    if op not in REDUCE_OPS:
+        raise ToolError(f"Unknown op '{op}'. Supported: {', '.join(REDUCE_OPS)}")
+
+    array = decode_array(values, "values")
+    if array.size == 0 and op in ("min", "max", "mean", "std"):
+        raise ToolError(f"Cannot compute {op} of an empty array")
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        return encode_scalar(REDUCE_OPS[op](array))
+
+
+@mcp.tool
+def batch_dot(a: Array, b: Array) -> Optional[float]:
+    """Returns the dot product of two equal-length arrays (JSON lists or base64).
+
+    Returns null when the result is not finite.
+    """
+    left = decode_array(a, "a")
+    right = decode_array(b, "b")
+    if left.size != right.size:
+        raise ToolError(f"a has {left.size} elements but b has {right.size}")
+    with np.errstate(over="ignore", invalid="ignore"):
+        return encode_scalar(np.dot(left, right))
+
+
 if __name__ == "__main__":
-    mcp.run()
\ No newline at end of file
+    mcp.run()
@@ -0,0 +1,166 @@
+import asyncio
+import functools
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+# strands-agent-generator/strands_agent_generator_mcp.py has the same
+# offload/ToolMetrics design; the two servers are separate projects with no shared
+# package, so apply fixes to both.
+
+# Shared worker pool for blocking tools, plus per-tool defaults.
+EXECUTOR_WORKERS = 8
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_QUEUE = 16
+METRICS_WINDOW = 1000
+
+_executor: Optional[ThreadPoolExecutor] = None
+_metrics: Dict[str, "ToolMetrics"] = {}
+
+
+class ToolMetrics:
+    """Per-tool counters and recent timings. Only mutated on the event loop thread."""
+
+    def __init__(self, max_concurrency: int, max_queue: int) -> None:
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.running = 0
+        self.queued = 0
+        self.calls = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.cancelled = 0
+        self.queue_waits_ms: "deque[float]" = deque(maxlen=METRICS_WINDOW)
+        self.run_times_ms: "deque[float]" = deque(maxlen=METRICS_WINDOW)
+
+    @property
+    def saturated(self) -> bool:
+        return self.running + self.queued >= self.max_concurrency + self.max_queue
+
+    def snapshot(self) -> Dict[str, Any]:
+        def summarize(samples: "deque[float]") -> Dict[str, float]:
+            if not samples:
+                return {"count": 0, "avg": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+            values = np.fromiter(samples, dtype=np.float64)
+            return {
+                "count": int(values.size),
+                "avg": round(float(values.mean()), 3),
+                "p50": round(float(np.percentile(values, 50)), 3),
+                "p99": round(float(np.percentile(values, 99)), 3),
+                "max": round(float(values.max()), 3),
+            }
+
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "running": self.running,
+            "queued": self.queued,
+            "calls": self.calls,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "cancelled": self.cancelled,
+            "queue_wait_ms": summarize(self.queue_waits_ms),
+            "run_time_ms": summarize(self.run_times_ms),
+        }
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Returns the shared thread pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=EXECUTOR_WORKERS, thread_name_prefix="strands-tool"
+        )
+    return _executor
+
+
+def metrics_snapshot() -> Dict[str, Any]:
+    """Returns the metrics of every offloaded tool, keyed by tool name."""
+    return {
+        "executor_workers": EXECUTOR_WORKERS,
+        "tools": {name: metrics.snapshot() for name, metrics in _metrics.items()},
+    }
+
+
+def offload(
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_queue: int = DEFAULT_MAX_QUEUE,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Runs a blocking tool on the shared thread pool instead of the event loop.
+
+    At most `max_concurrency` calls of the tool run at once and `max_queue` more
+    may wait; anything beyond that returns a busy message immediately instead of
+    queueing. Queue wait (per-tool limit plus pool backlog) is recorded separately
+    from run time. Place it below `@mcp.tool()` so the async wrapper is registered.
+
+    A cancelled call is counted in `cancelled`; if its thread already started, the
+    slot stays taken until the thread finishes, since the thread cannot be stopped.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        metrics = _metrics[fn.__name__] = ToolMetrics(max_concurrency, max_queue)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        def run(timing: Dict[str, float], args: Any, kwargs: Any) -> Any:
+            timing["started"] = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                timing["finished"] = time.perf_counter()
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            metrics.calls += 1
+            if metrics.saturated:
+                metrics.rejected += 1
+                return (
+                    f"Busy: {fn.__name__} has {metrics.running} running and "
+                    f"{metrics.queued} queued "
+                    f"(limit {metrics.max_concurrency}+{metrics.max_queue}). "
+                    "Try again shortly."
+                )
+
+            timing = {"enqueued": time.perf_counter()}
+            metrics.queued += 1
+            try:
+                await semaphore.acquire()
+            except asyncio.CancelledError:
+                metrics.cancelled += 1
+                raise
+            finally:
+                metrics.queued -= 1
+
+            def finish(future: "asyncio.Future[Any]") -> None:
+                # Runs on the event loop once the thread is done, even if the caller
+                # was cancelled.
+                metrics.running -= 1
+                semaphore.release()
+                if future.cancelled() or future.exception() is not None:
+                    metrics.failed += 1
+                else:
+                    metrics.completed += 1
+                if "finished" in timing:
+                    queue_wait = timing["started"] - timing["enqueued"]
+                    run_time = timing["finished"] - timing["started"]
+                    metrics.queue_waits_ms.append(queue_wait * 1000)
+                    metrics.run_times_ms.append(run_time * 1000)
+
+            metrics.running += 1
+            future = asyncio.get_running_loop().run_in_executor(
+                get_executor(), run, timing, args, kwargs
+            )
+            future.add_done_callback(finish)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                metrics.cancelled += 1
+                raise
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,201 @@
+import contextvars
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Tracing is off unless STRANDS_TRACE_FILE is set. Finished traces are then appended
+# to that file (resolved to an absolute path at startup) as OTLP/JSON lines, one
+# ExportTraceServiceRequest per trace, which the OpenTelemetry Collector
+# `otlpjsonfile` receiver can ingest. Once the file reaches STRANDS_TRACE_MAX_BYTES it
+# is rotated to `<file>.1`, replacing the previous rotation.
+TRACE_FILE = (
+    os.path.abspath(os.environ["STRANDS_TRACE_FILE"])
+    if os.environ.get("STRANDS_TRACE_FILE") else ""
+)
+TRACE_MAX_BYTES = int(os.environ.get("STRANDS_TRACE_MAX_BYTES", 64 * 1024 * 1024))
+SERVICE_NAME = "strands-mcp"
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_UNSET = 0
+STATUS_ERROR = 2
+
+_current_span: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar(
+    "current_span", default=None
+)
+_write_lock = threading.Lock()
+logger = logging.getLogger(__name__)
+
+
+def encode_value(value: Any) -> Dict[str, Any]:
+    """Encodes an attribute value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def encode_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {"key": key, "value": encode_value(value)}
+        for key, value in attributes.items() if value is not None
+    ]
+
+
+class Span:
+    """A timed operation. Children share the trace id and are exported with the root."""
+
+    def __init__(
+        self,
+        name: str,
+        parent: Optional["Span"],
+        kind: int,
+        attributes: Dict[str, Any],
+    ) -> None:
+        self.name = name
+        self.parent = parent
+        self.kind = kind
+        self.attributes = dict(attributes)
+        self.events: List[Dict[str, Any]] = []
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.status_code = STATUS_UNSET
+        self.status_message = ""
+        self.finished: List[Span] = parent.finished if parent else []
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def add_event(
+        self, name: str, timestamp_ns: Optional[int] = None, **attributes: Any
+    ) -> None:
+        self.events.append({
+            "timeUnixNano": str(timestamp_ns or time.time_ns()),
+            "name": name,
+            "attributes": encode_attributes(attributes),
+        })
+
+    def add_child(
+        self, name: str, start_ns: int, end_ns: int, **attributes: Any
+    ) -> "Span":
+        """Records an already-finished child span, e.g. a phase from a callback."""
+        child = Span(name, self, SPAN_KIND_INTERNAL, attributes)
+        child.start_ns, child.end_ns = start_ns, end_ns
+        self.finished.append(child)
+        return child
+
+    def record_exception(self, error: BaseException) -> None:
+        self.status_code = STATUS_ERROR
+        self.status_message = f"{type(error).__name__}: {error}"
+        self.add_event("exception", **{
+            "exception.type": type(error).__name__,
+            "exception.message": str(error),
+        })
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": encode_attributes(self.attributes),
+            "events": self.events,
+            "status": {"code": self.status_code, "message": self.status_message},
+        }
+        if self.parent:
+            span["parentSpanId"] = self.parent.span_id
+        return span
+
+
+@contextmanager
+def span(
+    name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any
+) -> Iterator[Span]:
+    """Times the enclosed block as a child of the current span (or as a new trace).
+
+    Exceptions mark the span as an error and propagate. When a root span ends, the
+    whole trace is written to TRACE_FILE; export failures are logged, never raised.
+    """
+    current = Span(name, _current_span.get(), kind, attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.record_exception(e)
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _current_span.reset(token)
+        current.finished.append(current)
+        if current.parent is None:
+            try:
+                export(current.finished)
+            except Exception as e:
+                logger.warning(
+                    "Dropping trace %s: cannot write %s (%s)",
+                    current.trace_id, TRACE_FILE, e,
+                )
+
+
+def export(spans: List[Span]) -> None:
+    """Appends one trace to TRACE_FILE as an OTLP/JSON ExportTraceServiceRequest."""
+    if not TRACE_FILE or not spans:
+        return
+    request = {
+        "resourceSpans": [{
+            "resource": {
+                "attributes": encode_attributes({"service.name": SERVICE_NAME})
+            },
+            "scopeSpans": [{
+                "scope": {"name": SERVICE_NAME},
+                "spans": [
+                    s.to_otlp() for s in sorted(spans, key=lambda s: s.start_ns)
+                ],
+            }],
+        }]
+    }
+    line = json.dumps(request, ensure_ascii=False)
+    with _write_lock:
+        full = (
+            os.path.exists(TRACE_FILE)
+            and os.path.getsize(TRACE_FILE) >= TRACE_MAX_BYTES
+        )
+        if full:
+            os.replace(TRACE_FILE, TRACE_FILE + ".1")
+        with open(TRACE_FILE, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def httpx_trace_hook(parent: Span) -> Callable[[str, Dict[str, Any]], None]:
+    """Returns an httpx `trace` extension callback recording transport phases as spans.
+
+    httpcore reports `<phase>.started` / `<phase>.complete` / `<phase>.failed` pairs
+    such as `connection.connect_tcp`, `connection.start_tls`,
+    `http11.send_request_headers` and `http11.receive_response_body`; each pair becomes
+    a child span under `parent`.
+    """
+    started: Dict[str, int] = {}
+
+    def hook(event_name: str, info: Dict[str, Any]) -> None:
+        phase, _, state = event_name.rpartition(".")
+        now = time.time_ns()
+        if state == "started":
+            started[phase] = now
+        elif phase in started:
+            child = parent.add_child(phase, started.pop(phase), now)
+            if state == "failed" and "exception" in info:
+                child.record_exception(info["exception"])
+
+    return hook
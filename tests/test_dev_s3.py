@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+dev/s3.py 개발용 버킷 정리 테스트 (moto)
+
+dev/ 아래 파이썬 파일은 push 시 실제 AWS 자격 증명으로 실행되므로 이 테스트는 dev/
+밖에 두고, moto가 가로채지 못한 호출이 실제 계정에 닿지 않도록 가짜 자격 증명을 씁니다.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Set
+
+import boto3
+from botocore.client import BaseClient
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+os.environ.update({
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "AWS_SESSION_TOKEN": "testing",
+    "AWS_DEFAULT_REGION": "us-east-1",
+})
+os.environ.pop("AWS_PROFILE", None)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "dev"))
+
+import s3  # noqa: E402
+
+REGION = "us-east-1"
+# moto의 버킷 생성 시각은 현재 시각이므로 정리 기준 시각을 미래로 옮겨 모두 오래된 버킷으로 만듦
+REAP_NOW = datetime.now() + timedelta(days=30)
+
+
+def make_buckets(client: BaseClient) -> Dict[str, str]:
+    """만료/최근/태그 없음/다른 환경/버전 관리 버킷을 만들고 이름을 반환합니다."""
+    (expired,), _ = s3.create_dev_buckets(1, client, REGION, datetime(2020, 1, 1))
+    (fresh,), _ = s3.create_dev_buckets(1, client, REGION, REAP_NOW)
+    (versioned,), _ = s3.create_dev_buckets(1, client, REGION, datetime(2020, 1, 1))
+
+    untagged = f"{s3.BUCKET_PREFIX}untagged"
+    client.create_bucket(Bucket=untagged)
+
+    other_env = f"{s3.BUCKET_PREFIX}shared"
+    client.create_bucket(Bucket=other_env)
+    client.put_bucket_tagging(Bucket=other_env, Tagging={"TagSet": [
+        {"Key": "Environment", "Value": "Staging"},
+        {"Key": "CreatedDate", "Value": "2020-01-01"},
+    ]})
+
+    client.put_bucket_versioning(
+        Bucket=versioned, VersioningConfiguration={"Status": "Enabled"}
+    )
+    for body in (b"v1", b"v2"):
+        client.put_object(Bucket=versioned, Key="data.txt", Body=body)
+    client.delete_object(Bucket=versioned, Key="data.txt")
+
+    return {
+        "expired": expired, "fresh": fresh, "versioned": versioned,
+        "untagged": untagged, "other_env": other_env,
+    }
+
+
+def remaining_buckets(client: BaseClient) -> Set[str]:
+    return {bucket["Name"] for bucket in client.list_buckets()["Buckets"]}
+
+
+@mock_aws
+def test_reap_deletes_only_expired_dev_buckets() -> None:
+    """태그 기준으로 만료된 버킷(버전/삭제 마커 포함)만 지우고 태그 없는 버킷은 남깁니다."""
+    client = boto3.client("s3", region_name=REGION)
+    names = make_buckets(client)
+
+    deleted, errors = s3.reap_dev_buckets(7, client, now=REAP_NOW)
+
+    assert errors == []
+    assert sorted(deleted) == sorted([names["expired"], names["versioned"]])
+    assert remaining_buckets(client) == {
+        names["fresh"], names["untagged"], names["other_env"]
+    }
+
+
+@mock_aws
+def test_reap_untagged_requires_opt_in() -> None:
+    """include_untagged면 태그 없는 버킷을 생성 시각으로 판단하고, dry run은 지우지 않습니다."""
+    client = boto3.client("s3", region_name=REGION)
+    names = make_buckets(client)
+
+    planned, _ = s3.reap_dev_buckets(
+        7, client, now=REAP_NOW, dry_run=True, include_untagged=True
+    )
+    assert names["untagged"] in planned
+    assert names["untagged"] in remaining_buckets(client)
+
+    deleted, errors = s3.reap_dev_buckets(
+        7, client, now=REAP_NOW, include_untagged=True
+    )
+    assert errors == []
+    assert names["untagged"] in deleted
+    assert names["untagged"] not in remaining_buckets(client)
+    assert names["fresh"] in remaining_buckets(client)
+
+
+@mock_aws
+def test_reap_collects_per_bucket_errors() -> None:
+    """한 버킷의 삭제가 실패해도 나머지는 지우고 실패는 (버킷, 오류)로 모읍니다."""
+    client = boto3.client("s3", region_name=REGION)
+    names = make_buckets(client)
+    delete_bucket = client.delete_bucket
+
+    def failing_delete_bucket(**kwargs: str) -> Dict[str, Any]:
+        if kwargs["Bucket"] == names["expired"]:
+            raise ClientError(
+                {"Error": {"Code": "AccessDenied", "Message": "denied"}}, "DeleteBucket"
+            )
+        return delete_bucket(**kwargs)
+
+    client.delete_bucket = failing_delete_bucket
+    deleted, errors = s3.reap_dev_buckets(7, client, now=REAP_NOW)
+
+    assert deleted == [names["versioned"]]
+    assert [bucket for bucket, _ in errors] == [names["expired"]]
+    assert isinstance(errors[0][1], ClientError)
+    assert names["expired"] in remaining_buckets(client)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")